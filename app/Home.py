@@ -2,9 +2,23 @@
 from __future__ import annotations
 from pathlib import Path
 from typing import List, Optional
+import sys
 import streamlit as st
 import pandas as pd
 
+def _add_project_root(marker="teasy_core"):
+    here = Path(__file__).resolve()
+    for p in [here] + list(here.parents):
+        if (p / marker).is_dir():
+            if str(p) not in sys.path:
+                sys.path.insert(0, str(p))
+            return str(p)
+    return None
+
+PROJECT_ROOT = _add_project_root()
+
+from teasy_core.logger import read_run_log
+
 # ── Page config (must be first) ───────────────────────────────────────────────
 st.set_page_config(page_title="Teasy App", page_icon="📰", layout="wide")
 
@@ -34,9 +48,9 @@ def safe_count_glob(patterns: List[str]) -> int:
 
 def read_runs_csv(path: Path, limit: int = 10) -> pd.DataFrame:
     try:
-        if not path.exists():
+        df = read_run_log(path)
+        if df.empty:
             return pd.DataFrame()
-        df = pd.read_csv(path)
 
         # Robust date/time parsing
         if "run_date" in df.columns:
@@ -118,7 +132,7 @@ st.divider()
 st.subheader("Recent runs")
 runs = read_runs_csv(LOGS_CSV, limit=12)
 if runs.empty:
-    st.info("No run logs yet. After your first run, logs will appear here (data/logs/runs.csv).")
+    st.info("No run logs yet. After your first run, logs will appear here (data/logs/).")
 else:
     st.dataframe(runs, width='stretch', hide_index=True)
 
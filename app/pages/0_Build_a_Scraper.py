@@ -257,13 +257,14 @@ def fetch_with_fallback(u: str, container_css: str, item_css: str):
     except Exception:
         pass
     f = HybridFetcher(js_required=True, page_load_strategy="eager")
-    final_url, body = f.get(
-        u,
-        headers={},
-        wait_for_css=(item_css.strip() or container_css.strip() or None),
-        wait_timeout=20,
-        consent_click_xpaths=KNOWN_CONSENT_XPATHS,
-    )
+    with f.session():  # one-off fetch: shut the driver down right after
+        final_url, body = f.get(
+            u,
+            headers={},
+            wait_for_css=(item_css.strip() or container_css.strip() or None),
+            wait_timeout=20,
+            consent_click_xpaths=KNOWN_CONSENT_XPATHS,
+        )
     return final_url, body, "Selenium"
 
 col1, col2 = st.columns([2,1])
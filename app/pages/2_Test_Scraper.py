@@ -14,7 +14,7 @@ def _add_project_root(marker="teasy_core"):
 PROJECT_ROOT = _add_project_root()
 
 import streamlit as st
-import yaml, pandas as pd
+import yaml
 
 from teasy_core.config import DEMO  # <-- demo flag (Cloud via Secrets/env)
 from teasy_core.models import ScraperSpec
@@ -23,6 +23,12 @@ from teasy_core.postprocess import REQUIRED_COLS
 
 SCRAPER_DIR = Path(__file__).resolve().parents[2] / "data" / "scrapers"
 
+@st.cache_data(show_spinner=False, hash_funcs={ScraperSpec: lambda s: s.model_dump_json()})
+def _planned_urls_cached(spec: ScraperSpec, vars_items: tuple, pages, fetch_all, page_from, page_to) -> list[str]:
+    # Pure function of the spec + paging inputs, so reruns can reuse the preview
+    return planned_urls(spec, vars=dict(vars_items), pages=pages, fetch_all=fetch_all,
+                        page_from=page_from, page_to=page_to)
+
 st.title("2 · Test Scraper")
 
 st.markdown(
@@ -101,13 +107,16 @@ else:
     eff_page_from = int(start_from)
     eff_pages = None  # ignored when fetch_all=True
 
-urls = planned_urls(
+# Apply the effective start page in-memory so the preview and the runner's relative math align
+spec.pagination.first_page = int(start_from)
+
+urls = _planned_urls_cached(
     spec,
-    vars=vars,
-    pages=eff_pages,
-    fetch_all=fetch_all,
-    page_from=eff_page_from,
-    page_to=eff_page_to,
+    tuple(sorted(vars.items())),
+    eff_pages,
+    fetch_all,
+    eff_page_from,
+    eff_page_to,
 )
 
 label = (
@@ -128,9 +137,6 @@ with st.expander("Planned URLs"):
 
 if st.button("Run test", type="primary", disabled=DEMO_DISABLED,
     help="Disabled in demo mode" if DEMO_DISABLED else "Runs the scraper with the chosen settings and shows a dataframe (no files are written).",):
-    # Apply the effective start page in-memory so the runner’s relative math aligns
-    spec.pagination.first_page = int(start_from)
-
     df = run_scraper(
         spec,
         vars=vars,
@@ -138,12 +144,11 @@ if st.button("Run test", type="primary", disabled=DEMO_DISABLED,
         fetch_all=fetch_all,
         page_from=eff_page_from if (page_mode != "Limit to N") else None,  # in limit mode we pass pages not range
         page_to=eff_page_to if (page_mode != "Limit to N") else None,
+        urls=None if fetch_all else urls,  # reuse the preview instead of rebuilding it
     )
 
-    for col in REQUIRED_COLS:
-        if col not in df.columns:
-            df[col] = None
-    df = df[[c for c in REQUIRED_COLS if c in df.columns] + [c for c in df.columns if c not in REQUIRED_COLS]]
+    ordered_cols = list(REQUIRED_COLS) + [c for c in df.columns if c not in REQUIRED_COLS]
+    df = df.reindex(columns=ordered_cols)
 
     st.write(f"Collected **{len(df)}** rows.")
     st.dataframe(df, width='stretch')
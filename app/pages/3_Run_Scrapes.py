@@ -16,16 +16,14 @@ def _add_project_root(marker="teasy_core"):
 PROJECT_ROOT = _add_project_root()
 
 import streamlit as st
-import yaml, pandas as pd
+import yaml
 from urllib.parse import urlparse
-import concurrent.futures
-import traceback
 from queue import SimpleQueue, Empty
 
 from teasy_core.config import DEMO                   # demo flag (Cloud via Secrets/env)
 from teasy_core.models import ScraperSpec
 from teasy_core.runner import run_scraper, slug_from_term, planned_urls
-from teasy_core.storage import save_or_merge_csv
+from teasy_core.storage import save_or_merge_csv, save_or_merge_csv_path
 from teasy_core.postprocess import REQUIRED_COLS
 from teasy_core.logger import append_run_log
 
@@ -63,26 +61,24 @@ def _load(path: Path) -> ScraperSpec:
     data = yaml.safe_load(path.read_text(encoding="utf-8"))
     return ScraperSpec.model_validate(data)
 
+_UNSAFE_SITE_RE = re.compile(r"[^a-z0-9_-]+")
+
 def normalize_site_key(raw: str, base_url: str | None = None) -> str:
     s = (raw or "").strip().lower()
     if not s and base_url:
-        host = (urlparse(base_url).hostname or "").lower()
-        s = host
-    # strip scheme/paths just in case
-    s = s.replace("http://", "").replace("https://", "")
-    s = s.split("/")[0]
-    # drop www.
-    if s.startswith("www."):
-        s = s[4:]
+        s = (urlparse(base_url).hostname or "").lower()
+    # strip scheme/paths just in case, then drop www.
+    if "://" in s:
+        s = s.partition("://")[2]
+    s = s.partition("/")[0].removeprefix("www.")
     # if it looks like a domain, take the first label (e.g., dnews.gr -> dnews)
     if "." in s:
-        parts = [p for p in s.split(".") if p]
-        if parts and parts[0] == "www":
-            parts = parts[1:]
-        if parts:
-            s = parts[0]
+        for label in s.split("."):
+            if label and label != "www":
+                s = label
+                break
     # keep only safe chars
-    s = re.sub(r"[^a-z0-9_-]+", "", s)
+    s = _UNSAFE_SITE_RE.sub("", s)
     return s or "site"
 
 def normalized_base_name(spec: ScraperSpec) -> str:
@@ -99,15 +95,24 @@ def normalized_base_name(spec: ScraperSpec) -> str:
     site = normalize_site_key(raw_site, base_url=str(spec.base_url))
     return f"{site}_{cat}"
 
+@st.cache_resource(show_spinner=False)
+def specs_by_category(dir_str: str, mtimes: tuple) -> dict[str, list[tuple[str, ScraperSpec]]]:
+    """
+    Parse every spec once and index it by category. `mtimes` is a tuple of
+    (file name, mtime) pairs, so adding/editing/removing a YAML invalidates the cache.
+    """
+    by_cat: dict[str, list[tuple[str, ScraperSpec]]] = {}
+    for name, _ in mtimes:
+        try:
+            sp = _load(Path(dir_str) / name)
+        except Exception:
+            continue
+        by_cat.setdefault(sp.category, []).append((name, sp))
+    return by_cat
+
 # collect specs by selected category
-specs: list[tuple[str, ScraperSpec]] = []
-for fp in all_files:
-    try:
-        sp = _load(fp)
-        if sp.category == target_cat:
-            specs.append((fp.name, sp))
-    except Exception:
-        continue
+mtimes = tuple((fp.name, fp.stat().st_mtime) for fp in all_files)
+specs = specs_by_category(str(SCRAPER_DIR), mtimes).get(target_cat, [])
 
 if not specs:
     st.info(f"No specs for category '{target_cat}'.")
@@ -116,6 +121,7 @@ if not specs:
 names = [n for n,_ in specs]
 select_all = st.checkbox(f"Select all ({len(names)})", value=True, help="Quickly select or clear all specs in the list.")
 chosen = st.multiselect("Choose specs", names, default=(names if select_all else []), help="Pick the exact specs to run. Hold Ctrl/Cmd to multi-select.")
+chosen_set = frozenset(chosen)
 
 # Page mode selector
 page_mode = st.radio(
@@ -174,8 +180,12 @@ run_clicked = st.button(
 )
 
 if run_clicked:
+    # Only needed once a run starts; keep them off the per-rerun import path
+    import concurrent.futures
+    import traceback
+
     for name, spec in specs:
-        if name not in chosen:
+        if name not in chosen_set:
             continue
 
         vars: dict[str, str] = {}
@@ -224,183 +234,183 @@ if run_clicked:
         base_norm = normalized_base_name(spec)          # define before running
         out_name = f"{base_norm}{slug_part}.csv"        # real file we will write/log
 
-        st.info(
-            f"Scraping **{spec.name}** — pages: {pages_label}"
-            + (f" — term: '{term_in}' → '{term_used}', slug: '{slug_part[1:]}'" if spec.category=='search' else "")
-        )
-
-        # Single-line status for "current URL being scraped"
-        current_url_placeholder = st.empty()
-        current_url_placeholder.caption("Waiting for first URL…")
-
-        with st.expander(f"Planned URLs for {spec.name}"):
-            st.caption("Preview of the exact URLs that will be requested for this spec.")
-            for u in urls:
-                st.write(u)
-
-        status = "ok"
-        msg = ""
-        rows = 0
-        events = SimpleQueue()
-        last_partial = {"file": None}
-        last_fetch = {"url": None, "page": None}
-
-        def _on_progress(ev: dict):
-            try:
-                events.put_nowait(ev)
-                # remember where runner is appending partials
-                if ev.get("event") == "partial_append" and ev.get("file"):
-                    last_partial["file"] = ev["file"]
-            except Exception:
-                pass
-
-        # Run with timeout so a stuck site doesn't block all others
-        try:
-            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as ex:
-                fut = ex.submit(
-                    run_scraper,
-                    spec,
-                    vars=vars,
-                    pages=effective_pages,
-                    fetch_all=effective_fetch_all,
-                    page_from=effective_page_from,
-                    page_to=effective_page_to,
-                    progress=_on_progress,
-                )
-
-                # track time from last successful fetch
-                last_progress_ts = time.time()
-
-                # Loop in main thread
-                while True:
-                    # empty events tail
-                    try:
-                        while True:
-                            ev = events.get_nowait()
-
-                            # progress event: start new fetch
-                            if ev.get("event") == "fetch_start" and ev.get("url"):
-                                url = ev["url"]
-                                page = ev.get("page")
-
-                                # store last page/url
-                                last_fetch["url"] = url
-                                last_fetch["page"] = page
-
-                                # reset idle timer
-                                last_progress_ts = time.time()
-
-                                # update UI
-                                if page is not None:
-                                    label = f"Current page {page}: {url}"
-                                else:
-                                    label = f"Current URL: {url}"
-                                current_url_placeholder.caption(label)
-
-                            # track partial_append
-                            if ev.get("event") == "partial_append":
-                                last_progress_ts = time.time()
-
-                    except Empty:
-                        pass
-
-                    # if future is done, break
-                    if fut.done():
-                        break
-
-                    # flag timeout only if there was no progress for Χ seconds
-                    if per_site_timeout and (time.time() - last_progress_ts > per_site_timeout):
-                        raise concurrent.futures.TimeoutError()
-
-                    time.sleep(0.1)
-
-                # if no TimeoutError, everything's good
-                df = fut.result()
-
-            rows = len(df)
-
-            # Ensure required cols exist & order columns
-            for col in REQUIRED_COLS:
-                if col not in df.columns:
-                    df[col] = None
-            df = df[[c for c in REQUIRED_COLS if c in df.columns] + [c for c in df.columns if c not in REQUIRED_COLS]]
-
-            # Save/merge
-            before, added, total = save_or_merge_csv(df, OUTPUT_DIR / out_name)
-            st.success(f"{base_norm} — +{added} / total {total} rows ✅ saved to data/outputs/{out_name}")
-            msg = f"added={added}, total={total}"
-            # Auto-clean partial file for this run (if any)
-            if last_partial["file"]:
+        with st.status(f"Scraping {spec.name}…", expanded=True) as spec_status:
+            st.info(
+                f"Scraping **{spec.name}** — pages: {pages_label}"
+                + (f" — term: '{term_in}' → '{term_used}', slug: '{slug_part[1:]}'" if spec.category=='search' else "")
+            )
+
+            # Single-line status for "current URL being scraped"
+            current_url_placeholder = st.empty()
+            current_url_placeholder.caption("Waiting for first URL…")
+
+            # Single slot for the planned URLs (expanders can't be nested in st.status)
+            planned_box = st.empty()
+            with planned_box.container():
+                st.caption("Planned URLs — preview of the exact URLs that will be requested for this spec.")
+                st.text("\n".join(urls))
+
+            status = "ok"
+            msg = ""
+            rows = 0
+            events = SimpleQueue()
+            last_partial = {"file": None}
+            last_fetch = {"url": None, "page": None}
+
+            def _on_progress(ev: dict):
                 try:
-                    Path(last_partial["file"]).unlink(missing_ok=True)
-                except Exception as e_del:
-                    st.warning(f"Could not delete partial file {last_partial['file']}: {e_del}")
-
-        except concurrent.futures.TimeoutError:
-            status = "timeout"
-            msg = f"Timed out after {per_site_timeout}s"
-            st.error(f"{spec.name} ⏱ {msg}")
-            # If we have a partial file, merge it so rows are not lost
+                    events.put_nowait(ev)
+                    # remember where runner is appending partials
+                    if ev.get("event") == "partial_append" and ev.get("file"):
+                        last_partial["file"] = ev["file"]
+                except Exception:
+                    pass
+
+            # Run with timeout so a stuck site doesn't block all others
             try:
+                with concurrent.futures.ThreadPoolExecutor(max_workers=1) as ex:
+                    fut = ex.submit(
+                        run_scraper,
+                        spec,
+                        vars=vars,
+                        pages=effective_pages,
+                        fetch_all=effective_fetch_all,
+                        page_from=effective_page_from,
+                        page_to=effective_page_to,
+                        progress=_on_progress,
+                        urls=None if effective_fetch_all else urls,
+                    )
+
+                    # track time from last successful fetch
+                    last_progress_ts = time.time()
+
+                    # Loop in main thread
+                    while True:
+                        # empty events tail
+                        try:
+                            while True:
+                                ev = events.get_nowait()
+
+                                # progress event: start new fetch
+                                if ev.get("event") == "fetch_start" and ev.get("url"):
+                                    url = ev["url"]
+                                    page = ev.get("page")
+
+                                    # store last page/url
+                                    last_fetch["url"] = url
+                                    last_fetch["page"] = page
+
+                                    # reset idle timer
+                                    last_progress_ts = time.time()
+
+                                    # update UI
+                                    if page is not None:
+                                        label = f"Current page {page}: {url}"
+                                    else:
+                                        label = f"Current URL: {url}"
+                                    current_url_placeholder.caption(label)
+
+                                # track partial_append
+                                if ev.get("event") == "partial_append":
+                                    last_progress_ts = time.time()
+
+                        except Empty:
+                            pass
+
+                        # if future is done, break
+                        if fut.done():
+                            break
+
+                        # flag timeout only if there was no progress for Χ seconds
+                        if per_site_timeout and (time.time() - last_progress_ts > per_site_timeout):
+                            raise concurrent.futures.TimeoutError()
+
+                        time.sleep(0.1)
+
+                    # if no TimeoutError, everything's good
+                    df = fut.result()
+
+                rows = len(df)
+
+                # Ensure required cols exist & order columns
+                ordered_cols = list(REQUIRED_COLS) + [c for c in df.columns if c not in REQUIRED_COLS]
+                df = df.reindex(columns=ordered_cols)
+
+                # Save/merge (run_scraper already keeps one row per URL)
+                before, added, total = save_or_merge_csv(df, OUTPUT_DIR / out_name, skip_new_dedup=True)
+                st.success(f"{base_norm} — +{added} / total {total} rows ✅ saved to data/outputs/{out_name}")
+                msg = f"added={added}, total={total}"
+                # Auto-clean partial file for this run (if any)
                 if last_partial["file"]:
-                    st.info("Merging rows from partial file created before timeout…")
-                    dfp = pd.read_csv(last_partial["file"])
-                    # Ensure required columns exist; drop dupes by URL if present
-                    for col in REQUIRED_COLS:
-                        if col not in dfp.columns:
-                            dfp[col] = None
-                    if "url" in dfp.columns:
-                        dfp = dfp.drop_duplicates(subset=["url"], keep="first")
-                    before, added, total = save_or_merge_csv(dfp, OUTPUT_DIR / out_name)
-                    st.success(f"{base_norm} — +{added} / total {total} rows ✅ (from partial)")
-                    # Auto-clean partial file after using it
                     try:
                         Path(last_partial["file"]).unlink(missing_ok=True)
                     except Exception as e_del:
                         st.warning(f"Could not delete partial file {last_partial['file']}: {e_del}")
 
-            except Exception as e_part:
-                st.warning(f"Could not merge partial rows: {e_part}")
-            if last_fetch["url"]:
-                if last_fetch["page"] is not None:
-                    st.warning(f"Last URL before timeout: {last_fetch['url']}  (page {last_fetch['page']})")
-                else:
-                    st.warning(f"Last URL before timeout: {last_fetch['url']}")
-
-        except Exception as e:
-            status = "fail"
-            msg = f"{type(e).__name__}: {e}"
-            st.error(f"{spec.name} ⏱ {msg}")
-
-            if last_fetch["url"]:
-                if last_fetch["page"] is not None:
-                    st.warning(f"Last URL before error: {last_fetch['url']}  (page {last_fetch['page']})")
-                else:
-                    st.warning(f"Last URL before error: {last_fetch['url']}")
-
-            # Show the tail of the traceback for quick debugging
-            tb = "".join(traceback.format_exc())
-            st.code(tb[-1200:])  # last ~1200 chars
-
-        finally:
-            # Always append a log row so you can see which site stalled/failed
-            try:
-                append_run_log(
-                    LOGS_CSV,
-                    spec_name=base_norm,
-                    category=spec.category,
-                    pages=pages_label,
-                    term_in=(term_in if spec.category=="search" else ""),
-                    term_used=(term_used if spec.category=="search" else ""),
-                    output_csv=out_name,     # actual filename
-                    rows=rows,
-                    status=status,
-                    message=msg,
-                )
-            except Exception as e_log:
-                st.warning(f"Could not write run log for {spec.name}: {e_log}")
-
-        st.divider()
+            except concurrent.futures.TimeoutError:
+                status = "timeout"
+                msg = f"Timed out after {per_site_timeout}s"
+                st.error(f"{spec.name} ⏱ {msg}")
+                # If we have a partial file, merge it so rows are not lost
+                try:
+                    if last_partial["file"]:
+                        st.info("Merging rows from partial file created before timeout…")
+                        # Stream rows across (deduped by URL) instead of loading the partial into pandas
+                        before, added, total = save_or_merge_csv_path(Path(last_partial["file"]), OUTPUT_DIR / out_name)
+                        st.success(f"{base_norm} — +{added} / total {total} rows ✅ (from partial)")
+                        # Auto-clean partial file after using it
+                        try:
+                            Path(last_partial["file"]).unlink(missing_ok=True)
+                        except Exception as e_del:
+                            st.warning(f"Could not delete partial file {last_partial['file']}: {e_del}")
+
+                except Exception as e_part:
+                    st.warning(f"Could not merge partial rows: {e_part}")
+                if last_fetch["url"]:
+                    if last_fetch["page"] is not None:
+                        st.warning(f"Last URL before timeout: {last_fetch['url']}  (page {last_fetch['page']})")
+                    else:
+                        st.warning(f"Last URL before timeout: {last_fetch['url']}")
+
+            except Exception as e:
+                status = "fail"
+                msg = f"{type(e).__name__}: {e}"
+                st.error(f"{spec.name} ⏱ {msg}")
+
+                if last_fetch["url"]:
+                    if last_fetch["page"] is not None:
+                        st.warning(f"Last URL before error: {last_fetch['url']}  (page {last_fetch['page']})")
+                    else:
+                        st.warning(f"Last URL before error: {last_fetch['url']}")
+
+                # Show the tail of the traceback for quick debugging
+                tb = "".join(traceback.format_exc())
+                st.code(tb[-1200:])  # last ~1200 chars
+
+            finally:
+                # Always append a log row so you can see which site stalled/failed
+                try:
+                    append_run_log(
+                        LOGS_CSV,
+                        spec_name=base_norm,
+                        category=spec.category,
+                        pages=pages_label,
+                        term_in=(term_in if spec.category=="search" else ""),
+                        term_used=(term_used if spec.category=="search" else ""),
+                        output_csv=out_name,     # actual filename
+                        rows=rows,
+                        status=status,
+                        message=msg,
+                    )
+                except Exception as e_log:
+                    st.warning(f"Could not write run log for {spec.name}: {e_log}")
+
+            # Collapse finished specs so a long run stays compact; keep failures open
+            spec_status.update(
+                label=f"{base_norm} — {status}" + (f" ({msg})" if msg else ""),
+                state="complete" if status == "ok" else "error",
+                expanded=(status != "ok"),
+            )
 
     st.info("Done.")
 
@@ -14,46 +14,51 @@ import streamlit as st
 import pandas as pd
 from pathlib import Path
 
+from teasy_core.logger import read_run_log, run_log_signature
+
 LOGS_CSV = Path(__file__).resolve().parents[2] / "data" / "logs" / "runs.csv"
 
+@st.cache_data(show_spinner=False)
+def _read_log_cached(path: str, signature: tuple, columns: tuple = None, filters: tuple = ()) -> pd.DataFrame:
+    # signature is part of the cache key, so a new run invalidates the cached frame
+    return read_run_log(Path(path), columns=columns, filters=dict(filters))
+
 st.title("4 · View Run Logs")
 
 st.markdown(
-    "Browse and filter **scrape runs** recorded in `data/logs/runs.csv`. "
+    "Browse and filter **scrape runs** recorded in `data/logs/` (`runs.csv` and the `runs/` Parquet parts). "
     "Use the dropdowns to filter by category, spec, or status. "
     "The table shows one row per run with date/time, pages, term, rows saved, and any message."
 )
 
-if not LOGS_CSV.exists():
+sig = run_log_signature(LOGS_CSV)
+if sig[0] == 0:
     st.info("No runs logged yet.")
     st.stop()
 
-df = pd.read_csv(LOGS_CSV)
-if 'run_date' in df.columns:
-    try:
-        df['run_date'] = pd.to_datetime(df['run_date'], errors='coerce').dt.date
-    except Exception:
-        pass
-
-cols = ['run_date','run_time','spec_name','category','pages','term_in','term_used','rows','status','output_csv','message']
-df = df[[c for c in cols if c in df.columns] + [c for c in df.columns if c not in cols]]
+# Only the two columns that feed the dropdowns are read here
+opts = _read_log_cached(str(LOGS_CSV), sig, columns=("category", "spec_name"))
 
 col1, col2, col3 = st.columns(3)
 with col1:
-    cats = ["(all)"] + sorted(df['category'].dropna().unique().tolist()) if 'category' in df else ["(all)"]
+    cats = ["(all)"] + sorted(opts['category'].dropna().unique().tolist()) if 'category' in opts else ["(all)"]
     cat = st.selectbox("Category", cats, help="Filter runs by scraper category (e.g., search, opinion). Choose (all) to show everything.")
 with col2:
-    specs = ["(all)"] + sorted(df['spec_name'].dropna().unique().tolist()) if 'spec_name' in df else ["(all)"]
+    specs = ["(all)"] + sorted(opts['spec_name'].dropna().unique().tolist()) if 'spec_name' in opts else ["(all)"]
     spec = st.selectbox("Spec", specs, help="Limit to a specific YAML spec name. Choose (all) to include every spec.")
 with col3:
     stat = st.selectbox("Status", ["(all)","ok","fail"], help="Show only successful runs (ok) or failures/timeouts (fail).")
 
-mask = pd.Series([True]*len(df))
-if 'category' in df and cat != "(all)":
-    mask &= (df['category'] == cat)
-if 'spec_name' in df and spec != "(all)":
-    mask &= (df['spec_name'] == spec)
-if 'status' in df and stat != "(all)":
-    mask &= (df['status'] == stat)
+# Selections are pushed down to the log scan, so only matching rows are materialized
+filters = tuple((k, v) for k, v in (("category", cat), ("spec_name", spec), ("status", stat)) if v != "(all)")
+df = _read_log_cached(str(LOGS_CSV), sig, filters=filters)
+if 'run_date' in df.columns:
+    try:
+        df['run_date'] = pd.to_datetime(df['run_date'], errors='coerce').dt.date
+    except Exception:
+        pass
+
+cols = ['run_date','run_time','spec_name','category','pages','term_in','term_used','rows','status','output_csv','message']
+df = df[[c for c in cols if c in df.columns] + [c for c in df.columns if c not in cols]]
 
-st.dataframe(df[mask].sort_values(by=['run_date','run_time'], ascending=[False, False]), width='stretch')
+st.dataframe(df.sort_values(by=['run_date','run_time'], ascending=[False, False]), width='stretch')
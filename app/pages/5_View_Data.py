@@ -16,6 +16,11 @@ from pathlib import Path
 
 OUTPUT_DIR = Path(__file__).resolve().parents[2] / "data" / "outputs"
 
+@st.cache_data(show_spinner=False)
+def _read_csv_cached(path: str, mtime: float) -> pd.DataFrame:
+    # mtime is part of the cache key, so a re-run of the scraper invalidates it
+    return pd.read_csv(path)
+
 st.title("5 · View Data")
 
 st.markdown(
@@ -28,5 +33,6 @@ if not files:
     st.info("No output CSVs yet.")
 else:
     fname = st.selectbox("CSV", [f.name for f in files], help="Choose which dataset to preview. Data is not modified here.")
-    df = pd.read_csv(OUTPUT_DIR / fname)
+    fp = OUTPUT_DIR / fname
+    df = _read_csv_cached(str(fp), fp.stat().st_mtime)
     st.dataframe(df, width='stretch')
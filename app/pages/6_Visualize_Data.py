@@ -1,10 +1,19 @@
 
 from __future__ import annotations
+import io
 from pathlib import Path
 from typing import List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 
 import streamlit as st
 import pandas as pd
+import numpy as np
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+except ImportError:  # optional; pandas' reader is used instead
+    pacsv = None
 
 # ---------- Project root & defaults ----------
 def _find_project_root(marker: str = "data") -> Path:
@@ -44,33 +53,80 @@ def list_outputs_df(dir_path: str) -> pd.DataFrame:
 
 @st.cache_data(show_spinner=False)
 def load_csv_trimmed(fp: str) -> pd.DataFrame:
-    df = pd.read_csv(fp)
-    if "date" not in df.columns:
-        if "published_at" in df.columns:
-            df["date"] = df["published_at"].astype(str)
-        else:
-            df["date"] = ""
-    df["date_str"] = df["date"].astype(str).str.strip().str[:10]
-    return df[["date_str"]]
+    # Peek at the header, then parse only the one date column we need
+    header = pd.read_csv(fp, nrows=0).columns
+    col = "date" if "date" in header else ("published_at" if "published_at" in header else None)
+    if col is None:
+        return pd.DataFrame({"date": pd.Series(dtype="datetime64[ns]"), "date_str": pd.Series(dtype="string")})
+    raw = None
+    if pacsv is not None:
+        # Arrow's multi-threaded reader prunes the other columns while parsing
+        try:
+            tbl = pacsv.read_csv(
+                fp,
+                read_options=pacsv.ReadOptions(use_threads=True),
+                convert_options=pacsv.ConvertOptions(include_columns=[col], column_types={col: pa.string()}),
+            )
+            raw = tbl.column(col).to_pandas()
+        except pa.ArrowInvalid:
+            raw = None  # e.g. ragged rows; let pandas have a go
+    if raw is None:
+        raw = pd.read_csv(fp, usecols=[col], dtype={col: "string"})[col]
+    # Parse once here (cache=True reuses results for repeated dates); the page no longer re-parses.
+    # Stored dates are ISO-like ('YYYY-MM-DD' or 'YYYY-MM-DDTHH:MM'), anything else becomes NaT.
+    date = pd.to_datetime(raw.str.strip().str.slice(0, 10), format="%Y-%m-%d", errors="coerce", cache=True)
+    return pd.DataFrame({"date": date, "date_str": date.dt.strftime("%Y-%m-%d")})
 
 @st.cache_data(show_spinner=False)
 def load_many_minimal(pairs: Tuple[Tuple[str, str], ...]) -> pd.DataFrame:
-    frames: List[pd.DataFrame] = []
-    for path, site in pairs:
+    def _load_one(pair: Tuple[str, str]) -> Optional[Tuple[str, pd.DataFrame]]:
+        path, site = pair
         try:
             d = load_csv_trimmed(path)
             if d is None or d.empty:
-                continue
-            d = d.copy()
-            d["site"] = site
-            frames.append(d[["site","date_str"]])
+                return None
+            d = d[d["date"].notna()]
+            return (site, d) if len(d) else None
         except Exception:
-            continue
-    if not frames:
-        return pd.DataFrame(columns=["site","date_str"])
-    out = pd.concat(frames, ignore_index=True)
-    out = out[out["date_str"].notna() & (out["date_str"] != "")]
-    return out
+            return None
+
+    # Reads are IO-bound and independent, so fan them out over a small pool
+    loaded: List[Tuple[str, pd.DataFrame]] = []
+    if pairs:
+        with ThreadPoolExecutor(max_workers=min(16, len(pairs))) as ex:
+            loaded = [r for r in ex.map(_load_one, pairs) if r is not None]
+    if not loaded:
+        return pd.DataFrame(columns=["site","date","date_str"])
+
+    # Fill preallocated columns slice by slice instead of pd.concat-ing N small frames
+    total = sum(len(d) for _, d in loaded)
+    sites = np.empty(total, dtype=object)
+    dates = np.empty(total, dtype="datetime64[ns]")
+    date_strs = np.empty(total, dtype=object)
+    pos = 0
+    for site, d in loaded:
+        n = len(d)
+        sites[pos:pos + n] = site
+        dates[pos:pos + n] = d["date"].to_numpy(dtype="datetime64[ns]")
+        date_strs[pos:pos + n] = d["date_str"].to_numpy(dtype=object)
+        pos += n
+    # site/date_str repeat heavily, so store them as categoricals (smaller, faster to count)
+    return pd.DataFrame({
+        "site": pd.Categorical(sites),
+        "date": dates,
+        "date_str": pd.Categorical(date_strs),
+    })
+
+@st.cache_data(show_spinner=False)
+def _derive_options(meta: pd.DataFrame) -> dict:
+    # Selectbox feeders only change when the file listing does, not on every widget rerun
+    return {
+        "categories": sorted(meta["category"].dropna().unique()),
+        "slugs_by_cat": {
+            c: sorted(s)
+            for c, s in meta.dropna(subset=["slug"]).groupby("category")["slug"].unique().items()
+        },
+    }
 
 # ---------- UI ----------
 st.set_page_config(page_title="6 · Visualize", page_icon="📈", layout="wide")
@@ -94,13 +150,14 @@ if meta.empty:
     st.stop()
 
 # Step 1: Category
-categories = sorted(meta["category"].dropna().unique().tolist())
+options = _derive_options(meta)
+categories = options["categories"]
 cat = st.selectbox("Select category", options=["(select)"] + categories, index=0, help="Filters datasets by their category (e.g., search, opinion, all).")
 
 # Step 2: Slug (search term) if category == search
 slug = None
 if cat == "search":
-    slugs = sorted(meta.loc[meta["category"]=="search", "slug"].dropna().unique().tolist())
+    slugs = options["slugs_by_cat"].get("search", [])
     slug = st.selectbox("Select search term (from filename)", options=["(select)"] + slugs, index=0, help="For 'search' datasets: choose which search term to visualize.")
     if slug == "(select)":
         slug = None
@@ -122,24 +179,8 @@ if filtered.empty:
     st.error("No files match your selection.")
     st.stop()
 
-# Load minimal date data for only the matched files
-pairs = tuple((row["path"], row["site"]) for _, row in filtered.iterrows())
-data = load_many_minimal(pairs)
-if data.empty:
-    st.warning("No rows with dates in the matching files.")
-    st.stop()
-
-# Step 3: Date range (based on available dates)
-dates = pd.to_datetime(data["date_str"], errors="coerce")
-dates = dates.dropna()
-if dates.empty:
-    st.warning("No valid dates parsed.")
-    st.stop()
-min_d, max_d = dates.min().date(), dates.max().date()
-date_range = st.date_input("Date range", value=(min_d, max_d), min_value=min_d, max_value=max_d, help="Limits the timeline to a specific date interval.")
-
-# Step 4: Sites (with Select-all)
-all_sites = sorted(data["site"].unique().tolist())
+# Step 3: Sites (with Select-all), taken from the filenames so unselected files are never read
+all_sites = sorted(filtered["site"].unique().tolist())
 col_sites1, col_sites2 = st.columns([1,3])
 with col_sites1:
     select_all = st.checkbox("Select all sites", value=True)
@@ -150,19 +191,32 @@ with col_sites2:
     else:
         sel_sites = st.multiselect("Sites", options=all_sites, default=all_sites, key="sites_ms", help="Pick which sites to include in charts and tables.")
 
-# Apply filters
+filtered = filtered[filtered["site"].isin(sel_sites)]
+if filtered.empty:
+    st.info("Pick at least one site to continue.")
+    st.stop()
+
+# Load minimal date data for only the selected files
+pairs = tuple(zip(filtered["path"], filtered["site"]))
+data = load_many_minimal(pairs)
+if data.empty:
+    st.warning("No rows with dates in the matching files.")
+    st.stop()
+
+# Step 4: Date range (based on available dates; already parsed by the loader)
+min_d, max_d = data["date"].min().date(), data["date"].max().date()
+date_range = st.date_input("Date range", value=(min_d, max_d), min_value=min_d, max_value=max_d, help="Limits the timeline to a specific date interval.")
+
+# Apply filters (sites were already applied before loading)
 start, end = date_range if isinstance(date_range, (list, tuple)) else (date_range, date_range)
-mask = pd.Series(True, index=data.index)
-mask &= data["site"].isin(sel_sites)
-dser = pd.to_datetime(data["date_str"], errors="coerce")
-mask &= (dser >= pd.Timestamp(start)) & (dser <= pd.Timestamp(end))
-df_f = data[mask].copy()
+df_f = data[data["date"].between(pd.Timestamp(start), pd.Timestamp(end))].copy()
 
 st.divider()
 
 # Chart 1: Bar chart articles per site
 st.subheader("Articles per site")
-bar = df_f.groupby("site").size().reset_index(name="articles").sort_values("articles", ascending=False)
+site_counts = df_f["site"].value_counts()
+bar = site_counts[site_counts > 0].rename_axis("site").reset_index(name="articles")
 if bar.empty:
     st.info("No rows for the selected filters.")
 else:
@@ -179,11 +233,8 @@ else:
 
 # Chart 2: Timeline aggregated across selected sites
 st.subheader("Articles per day (aggregated across selected sites)")
-ts = (
-    df_f.groupby("date_str").size()
-        .reset_index(name="articles")
-        .sort_values("date_str")
-)
+day_counts = df_f["date_str"].value_counts().sort_index()
+ts = day_counts[day_counts > 0].rename_axis("date_str").reset_index(name="articles")
 if ts.empty:
     st.info("No rows to plot for the current selection.")
 else:
@@ -201,9 +252,12 @@ else:
 # Table & downloads
 with st.expander("Show aggregated daily counts", expanded=False):
     st.dataframe(ts, width='stretch', height=260)
+    # write straight to bytes instead of building a str and re-encoding it
+    buf = io.BytesIO()
+    ts.to_csv(buf, index=False, encoding="utf-8", lineterminator="\n")
     st.download_button(
         "Download daily counts CSV",
-        data=ts.to_csv(index=False).encode("utf-8"),
+        data=buf.getvalue(),
         file_name=f"daily_counts_{cat}" + (f"_{slug}" if slug else "") + ".csv",
         mime="text/csv"
     )
@@ -1,9 +1,23 @@
 from __future__ import annotations
 from bs4 import BeautifulSoup
 from lxml import etree
+import soupsieve as sv
+import functools
 from typing import Optional, List, Dict
 from .models import Selector, FieldMap
 
+try:
+    import lxml.html as lxhtml
+    from cssselect import HTMLTranslator, SelectorError
+    from cssselect.xpath import ExpressionError
+    _CSS_TRANSLATOR = HTMLTranslator()
+except ImportError:  # no cssselect -> always use the BeautifulSoup path
+    _CSS_TRANSLATOR = None
+
+_FIELDS = ("title", "url", "date", "summary", "section")
+# Same strings BeautifulSoup's get_text() leaves out (besides comments)
+_NON_TEXT_TAGS = frozenset({"script", "style", "template", "rt", "rp"})
+
 def _get_text_or_attr(el, attr: Optional[str]):
     if el is None:
         return None
@@ -17,17 +31,155 @@ def _get_text_or_attr(el, attr: Optional[str]):
     except Exception:
         return None
 
-def _sel_all(soup_or_el, sel: Optional[Selector]):
+def _sel_all(soup_or_el, sel: Optional[Selector], xp_root=None):
     if sel is None:
         return []
     if sel.type == "css":
         return soup_or_el.select(sel.query)
     elif sel.type == "xpath":
-        root = etree.HTML(str(soup_or_el))
+        # xp_root: lxml tree already built for this scope, to avoid re-serializing per selector
+        root = xp_root if xp_root is not None else etree.HTML(str(soup_or_el))
         return root.xpath(sel.query)
     return []
 
+def _compile_selectors(selectors: FieldMap) -> Dict[str, object]:
+    """Compile each css/xpath field selector once, so the item loop doesn't re-parse the query strings."""
+    compiled: Dict[str, object] = {}
+    for name in ("title", "url", "date", "summary", "section"):
+        sel = getattr(selectors, name)
+        if sel is None:
+            continue
+        if sel.type == "css":
+            compiled[name] = sv.compile(sel.query)
+        elif sel.type == "xpath":
+            compiled[name] = etree.XPath(sel.query)
+    return compiled
+
+def _sel_one(soup_or_el, matcher, xp_root=None):
+    """First match of a compiled selector (CSS stops walking at the first hit), or None."""
+    if matcher is None:
+        return None
+    if isinstance(matcher, etree.XPath):
+        root = xp_root if xp_root is not None else etree.HTML(str(soup_or_el))
+        found = matcher(root)
+        return found[0] if found else None
+    return matcher.select_one(soup_or_el)
+
+def _uses_xpath(selectors: FieldMap) -> bool:
+    return any(
+        s is not None and s.type == "xpath"
+        for s in (selectors.title, selectors.url, selectors.date, selectors.summary, selectors.section)
+    )
+
+@functools.lru_cache(maxsize=256)
+def _css_xpath(css: str) -> etree.XPath:
+    return etree.XPath(_CSS_TRANSLATOR.css_to_xpath(css, prefix="descendant-or-self::"))
+
+def _lx_text(el) -> str:
+    """Equivalent of BeautifulSoup's get_text(strip=True) on a raw lxml element."""
+    parts: List[str] = []
+    def walk(node):
+        if not isinstance(node.tag, str) or node.tag in _NON_TEXT_TAGS:
+            return  # comments / PIs / script-like content
+        if node.text:
+            parts.append(node.text.strip())
+        for child in node:
+            walk(child)
+            if child.tail:
+                parts.append(child.tail.strip())
+    walk(el)
+    return "".join(parts)
+
+def _lx_value(el, attr: Optional[str]):
+    if el is None:
+        return None
+    if attr:
+        return el.get(attr)
+    return _lx_text(el)
+
+def _in_scope(matches: List, scope, root) -> List:
+    # Selectors are matched against the whole document (like soupsieve), then limited
+    # to the descendants of the scope element, in document order.
+    if scope is root:
+        return matches
+    ms = set(matches)
+    return [e for e in scope.iterdescendants() if e in ms]
+
+def _extract_items_lxml(html: str, selectors: FieldMap, container_css: Optional[str], item_css: Optional[str]) -> Optional[List[Dict]]:
+    """
+    Fast path on raw lxml elements with cssselect-compiled selectors.
+    Returns None when it can't be used (xpath/json selectors, CSS that cssselect
+    doesn't support, or markup lxml.html refuses), so the caller falls back to BeautifulSoup.
+    """
+    if _CSS_TRANSLATOR is None:
+        return None
+    fields = {name: getattr(selectors, name) for name in _FIELDS if getattr(selectors, name) is not None}
+    if any(sel.type != "css" for sel in fields.values()):
+        return None
+    try:
+        field_xps = {name: _css_xpath(sel.query) for name, sel in fields.items()}
+        container_xp = _css_xpath(container_css) if container_css else None
+        item_xp = _css_xpath(item_css) if item_css else None
+        root = lxhtml.document_fromstring(html)
+    except (SelectorError, ExpressionError, ValueError, etree.ParserError):
+        return None
+
+    rows: List[Dict] = []
+    scope = root
+    if container_xp is not None:
+        found = container_xp(root)
+        if not found:
+            # If main container returns 0, there are no articles
+            return rows
+        scope = found[0]
+
+    if item_xp is not None:
+        field_sets = {name: set(xp(root)) for name, xp in field_xps.items()}
+        for it in _in_scope(item_xp(root), scope, root):
+            # one walk of the item picks the first match for every field
+            firsts: Dict[str, object] = {}
+            for e in it.iterdescendants():
+                for name, ms in field_sets.items():
+                    if name not in firsts and e in ms:
+                        firsts[name] = e
+                if len(firsts) == len(field_sets):
+                    break
+            title = _lx_value(firsts.get("title"), fields["title"].attr)
+            url = _lx_value(firsts.get("url"), fields["url"].attr) if "url" in fields else None
+            if not title and not url:
+                continue
+            row = {"title": title, "url": url}
+            for k in ("date", "summary", "section"):
+                row[k] = _lx_value(firsts.get(k), fields[k].attr) if k in fields else None
+            rows.append(row)
+        return rows
+
+    found_by_field = {name: _in_scope(xp(root), scope, root) for name, xp in field_xps.items()}
+    n_titles = len(found_by_field["title"])
+    n_urls = len(found_by_field.get("url", []))
+    n = max(n_titles, n_urls) if n_urls else n_titles
+    def _nth(k: str, i: int):
+        found = found_by_field[k]
+        return _lx_value(found[i] if i < len(found) else None, fields[k].attr)
+
+    for i in range(n):
+        title = _nth("title", i) or None
+        url = (_nth("url", i) or None) if "url" in fields else None
+        if not title and not url:
+            continue
+        row = {"title": title, "url": url}
+        for k in ("date", "summary", "section"):
+            row[k] = _nth(k, i) if k in fields else None
+        rows.append(row)
+    return rows
+
 def extract_items(html: str, selectors: FieldMap, container_css: Optional[str] = None, item_css: Optional[str] = None) -> List[Dict]:
+    rows = _extract_items_lxml(html, selectors, container_css, item_css)
+    if rows is not None:
+        return rows
+    return _extract_items_soup(html, selectors, container_css, item_css)
+
+def _extract_items_soup(html: str, selectors: FieldMap, container_css: Optional[str], item_css: Optional[str]) -> List[Dict]:
     soup = BeautifulSoup(html, "lxml")
     scope = soup
     if container_css:
@@ -35,27 +187,31 @@ def extract_items(html: str, selectors: FieldMap, container_css: Optional[str] =
         if not found:
             # If main container returns 0, there are no articles
             return []
-        scope = BeautifulSoup(str(found[0]), "lxml")
+        # .select() works directly on the Tag; no need to serialize and re-parse it
+        scope = found[0]
+    use_xpath = _uses_xpath(selectors)
 
     rows: List[Dict] = []
     if item_css:
         items = scope.select(item_css)
+        compiled = _compile_selectors(selectors)
         for it in items:
+            it_root = etree.HTML(str(it)) if use_xpath else None
             row = {}
-            row["title"] = _get_text_or_attr((_sel_all(it, selectors.title) or [None])[0], selectors.title.attr)
+            row["title"] = _get_text_or_attr(_sel_one(it, compiled.get("title"), it_root), selectors.title.attr)
             if selectors.url:
                 row["url"] = _get_text_or_attr(
-                    (_sel_all(it, selectors.url) or [None])[0],
+                    _sel_one(it, compiled.get("url"), it_root),
                     selectors.url.attr,
                 )
             else:
                 row["url"] = None
             if selectors.date:
-                row["date"] = _get_text_or_attr((_sel_all(it, selectors.date) or [None])[0], selectors.date.attr)
+                row["date"] = _get_text_or_attr(_sel_one(it, compiled.get("date"), it_root), selectors.date.attr)
             if selectors.summary:
-                row["summary"] = _get_text_or_attr((_sel_all(it, selectors.summary) or [None])[0], selectors.summary.attr)
+                row["summary"] = _get_text_or_attr(_sel_one(it, compiled.get("summary"), it_root), selectors.summary.attr)
             if selectors.section:
-                row["section"] = _get_text_or_attr((_sel_all(it, selectors.section) or [None])[0], selectors.section.attr)
+                row["section"] = _get_text_or_attr(_sel_one(it, compiled.get("section"), it_root), selectors.section.attr)
             for k in ["title","url","date","summary","section"]:
                 row.setdefault(k, None)
             if not row.get("title") and not row.get("url"):
@@ -63,12 +219,14 @@ def extract_items(html: str, selectors: FieldMap, container_css: Optional[str] =
             rows.append(row)
         return rows
 
-    titles = _sel_all(scope, selectors.title)
-    urls = _sel_all(scope, selectors.url) if selectors.url else []
+    # Parse the scope for xpath once (the raw html when there is no container)
+    xp_root = (etree.HTML(html) if scope is soup else etree.HTML(str(scope))) if use_xpath else None
+    titles = _sel_all(scope, selectors.title, xp_root)
+    urls = _sel_all(scope, selectors.url, xp_root) if selectors.url else []
     n = max(len(titles), len(urls)) if urls else len(titles)
-    dates = _sel_all(scope, selectors.date) if selectors.date else []
-    summaries = _sel_all(scope, selectors.summary) if selectors.summary else []
-    sections = _sel_all(scope, selectors.section) if selectors.section else []
+    dates = _sel_all(scope, selectors.date, xp_root) if selectors.date else []
+    summaries = _sel_all(scope, selectors.summary, xp_root) if selectors.summary else []
+    sections = _sel_all(scope, selectors.section, xp_root) if selectors.section else []
 
     for i in range(n):
         t_el = titles[i] if i < len(titles) else None
@@ -132,20 +290,29 @@ def selector_diagnostics(html: str, selectors: FieldMap, container_css: Optional
             if selectors.summary: counts["summary_matches"] = 0
             if selectors.section: counts["section_matches"] = 0
             return counts
-        scope = BeautifulSoup(str(found[0]), "lxml")
+        scope = found[0]
     else:
         counts["container_found"] = 0
 
     if item_css:
         counts["items"] = len(scope.select(item_css))
-    counts["title_matches"] = len(_sel_all(scope, selectors.title))
+        if counts["items"] == 0:
+            # No items => field counts are meaningless, skip the selector walks
+            counts["title_matches"] = 0
+            counts["url_matches"] = 0
+            if selectors.date: counts["date_matches"] = 0
+            if selectors.summary: counts["summary_matches"] = 0
+            if selectors.section: counts["section_matches"] = 0
+            return counts
+    xp_root = (etree.HTML(html) if scope is soup else etree.HTML(str(scope))) if _uses_xpath(selectors) else None
+    counts["title_matches"] = len(_sel_all(scope, selectors.title, xp_root))
     if selectors.url:
-        counts["url_matches"] = len(_sel_all(scope, selectors.url))
+        counts["url_matches"] = len(_sel_all(scope, selectors.url, xp_root))
     if selectors.date:
-        counts["date_matches"] = len(_sel_all(scope, selectors.date))
+        counts["date_matches"] = len(_sel_all(scope, selectors.date, xp_root))
     if selectors.summary:
-        counts["summary_matches"] = len(_sel_all(scope, selectors.summary))
+        counts["summary_matches"] = len(_sel_all(scope, selectors.summary, xp_root))
     if selectors.section:
-        counts["section_matches"] = len(_sel_all(scope, selectors.section))
+        counts["section_matches"] = len(_sel_all(scope, selectors.section, xp_root))
 
     return counts
@@ -1,8 +1,9 @@
 from __future__ import annotations
-import os, time, random, shutil
+import os, time, random, shutil, atexit
 import requests
 from typing import Protocol, Dict, List, Optional
 from contextlib import contextmanager
+from pathlib import Path
 
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -17,6 +18,14 @@ from selenium.webdriver.support import expected_conditions as EC
 
 from .utils import user_agent
 
+try:
+    from cachecontrol import CacheControlAdapter
+    from cachecontrol.caches import FileCache
+except ImportError:  # caching is optional; fall back to a plain adapter
+    CacheControlAdapter = None
+
+HTTP_CACHE_DIR = Path(__file__).resolve().parents[1] / "data" / ".http_cache"
+
 
 
 class Fetcher(Protocol):
@@ -38,33 +47,44 @@ class RequestsFetcher:
         self.timeout = timeout
         self.min_delay = min_delay
         self.max_delay = max_delay
+        # one UA per fetcher instance, like a single browser session
+        self._base_headers = {"User-Agent": user_agent(), "Accept-Language": "el-GR,el;q=0.9,en-US;q=0.8,en;q=0.7"}
         self.session = requests.Session()
         retry = Retry(total=total_retries, backoff_factor=backoff_factor,
                       status_forcelist=[429,500,502,503,504],
                       allowed_methods=["GET","HEAD","OPTIONS"], raise_on_status=False)
-        adapter = HTTPAdapter(max_retries=retry, pool_maxsize=10)
+        if CacheControlAdapter is not None:
+            # Honor Cache-Control/ETag/Last-Modified so re-runs get 304s or cache hits
+            adapter = CacheControlAdapter(cache=FileCache(str(HTTP_CACHE_DIR)),
+                                          max_retries=retry, pool_maxsize=10)
+        else:
+            adapter = HTTPAdapter(max_retries=retry, pool_maxsize=10)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
     def get(self, url: str, headers: Dict[str, str] | None = None, **_) -> tuple[str, str]:
-        time.sleep(random.uniform(self.min_delay, self.max_delay))
-        h = {"User-Agent": user_agent(), "Accept-Language": "el-GR,el;q=0.9,en-US;q=0.8,en;q=0.7"}
-        if headers:
-            h.update(headers)
+        h = {**self._base_headers, **(headers or {})}
         r = self.session.get(url, headers=h, timeout=self.timeout)
+        # Politeness delay only when we actually hit the site, not on cache hits
+        if not getattr(r, "from_cache", False):
+            time.sleep(random.uniform(self.min_delay, self.max_delay))
         r.raise_for_status()
         return (r.url, r.text)
 
 class SeleniumFetcher:
     def __init__(self, headless: bool = True, page_load_timeout: int = 30,
                  wait_after_load: float = 1.0, page_load_strategy: str = "eager",
-                 window_size: str = "1400,1600"):
+                 window_size: str = "1400,1600", max_reuses: int = 50):
         self.headless = headless if os.environ.get("HEADLESS", "").lower() != "false" else False
         self.page_load_timeout = page_load_timeout
         self.wait_after_load = wait_after_load
         self.page_load_strategy = page_load_strategy
         self.window_size = window_size
+        self._ua = user_agent()
+        # recycle the long-lived driver every N pages to keep Chrome's memory in check
+        self.max_reuses = max_reuses
         self._driver = None
+        self._uses = 0
 
     def _build_driver(self):
         opts = Options()
@@ -74,7 +94,7 @@ class SeleniumFetcher:
         opts.add_argument("--disable-dev-shm-usage")
         opts.add_argument("--disable-gpu")
         opts.add_argument("--lang=el-GR")
-        opts.add_argument(f"--user-agent={user_agent()}")
+        opts.add_argument(f"--user-agent={self._ua}")
         opts.add_argument(f"--window-size={self.window_size}")
         opts.add_experimental_option("excludeSwitches", ["enable-automation"])
         opts.add_experimental_option("useAutomationExtension", False)
@@ -106,6 +126,9 @@ class SeleniumFetcher:
     def start(self):
         if self._driver is None:
             self._driver = self._build_driver()
+            self._uses = 0
+            # make sure Chrome doesn't outlive the process if stop() is never reached
+            atexit.register(self.stop)
 
     def stop(self):
         if self._driver is not None:
@@ -114,6 +137,12 @@ class SeleniumFetcher:
             except Exception:
                 pass
             self._driver = None
+            atexit.unregister(self.stop)
+
+    def _recycle_if_worn(self):
+        if self._driver is not None and self.max_reuses and self._uses >= self.max_reuses:
+            self.stop()
+            self.start()
 
     def _ensure_driver(self):
         if self._driver is None:
@@ -137,7 +166,10 @@ class SeleniumFetcher:
     def get(self, url: str, headers: Dict[str, str] | None = None,
             wait_for_css: str | None = None, wait_timeout: int | None = None,
             consent_click_xpaths: Optional[List[str]] = None) -> tuple[str, str]:
+        self._recycle_if_worn()
         d, ephemeral = self._ensure_driver()
+        if not ephemeral:
+            self._uses += 1
         try:
             d.get(url)
             if consent_click_xpaths:
@@ -168,17 +200,16 @@ class HybridFetcher:
 
     @contextmanager
     def session(self):
-        if self._use_selenium:
-            with self.sel.session():
-                yield self
-        else:
-            try:
-                yield self
-            finally:
-                self.sel.stop()
+        # The driver is started lazily by get() and kept for the whole session
+        try:
+            yield self
+        finally:
+            self.sel.stop()
 
     def get(self, url: str, headers: Dict[str, str] | None = None, **sel_kwargs) -> tuple[str, str]:
         if self._use_selenium:
+            # Reuse one driver across pages instead of an ephemeral Chrome per URL
+            self.sel.start()
             return self.sel.get(url, headers=headers, **sel_kwargs)
         try:
             return self.req.get(url, headers=headers)
@@ -1,31 +1,137 @@
 from __future__ import annotations
 from pathlib import Path
-import pandas as pd
+from typing import Dict, Iterable, Optional
+import csv
+import os
 from datetime import datetime
 
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as pads
+    import pyarrow.fs as pafs
+    import pyarrow.parquet as pq
+except ImportError:  # optional; logs stay in the plain CSV
+    pa = None
+
+def run_log_dir(log_csv: Path) -> Path:
+    # data/logs/runs.csv -> data/logs/runs/run_date=YYYY-MM-DD/part.parquet
+    return log_csv.with_suffix("")
+
+_DAY_FILE = "part.parquet"
+
+def _day_parts(d: Path) -> list:
+    # One file per day, so this stays a handful of paths. Day directories sort
+    # chronologically; inside one, parts left by the old one-file-per-run layout
+    # (uuid names, all < "part") come before the day file that later absorbs them.
+    return sorted(d.glob("run_date=*/*.parquet")) if d.is_dir() else []
+
+def run_log_signature(log_csv: Path) -> tuple:
+    """Cheap change marker for caching: (file count, newest mtime) over the CSV and Parquet parts."""
+    paths = ([log_csv] if log_csv.exists() else []) + _day_parts(run_log_dir(log_csv))
+    return (len(paths), max((p.stat().st_mtime for p in paths), default=0.0))
+
+def _append_csv(log_csv: Path, fields: Dict):
+    header = None
+    if log_csv.exists():
+        # only the header line is needed to align the new row's columns
+        with log_csv.open(newline="", encoding="utf-8") as f:
+            first = f.readline()
+        if first.strip():
+            header = next(csv.reader([first]))
+
+    # append a single row instead of rewriting the whole log
+    with log_csv.open("a", newline="", encoding="utf-8") as f:
+        if header is None:
+            # log file doesn't exist yet, or it's empty / has no header
+            header = list(fields)
+            writer = csv.DictWriter(f, fieldnames=header, extrasaction="ignore")
+            writer.writeheader()
+        else:
+            writer = csv.DictWriter(f, fieldnames=header, extrasaction="ignore")
+        writer.writerow(fields)
+
 def append_run_log(log_csv: Path, **fields):
     log_csv.parent.mkdir(parents=True, exist_ok=True)
     now = datetime.now()
     fields.setdefault("run_date", now.strftime("%Y-%m-%d"))
     fields.setdefault("run_time", now.strftime("%H:%M:%S"))
 
-    # new row for this run
-    df = pd.DataFrame([fields])
+    if pa is None:
+        _append_csv(log_csv, fields)
+        return
+
+    # Everything is stored as strings so rows written by different versions
+    # always share a schema; run_date lives in the directory name only.
+    row = pa.table({k: pa.array(["" if v is None else str(v)], type=pa.string())
+                    for k, v in fields.items() if k != "run_date"})
+    day = run_log_dir(log_csv) / f"run_date={fields['run_date']}"
+    day.mkdir(parents=True, exist_ok=True)
+    target = day / _DAY_FILE
+
+    # A day holds a few dozen runs at most, so appending rewrites its file:
+    # rows stay in the order they were logged and the dataset doesn't grow a
+    # part per run. Old-layout parts are folded in (by run_time) on the way.
+    legacy = [pq.ParquetFile(p).read() for p in sorted(day.glob("*.parquet")) if p != target]
+    legacy.sort(key=lambda t: t.column("run_time")[0].as_py() if "run_time" in t.column_names else "")
+    tables = legacy + ([pq.ParquetFile(target).read()] if target.exists() else []) + [row]
+    tmp = day / f".{_DAY_FILE}.tmp"
+    pq.write_table(pa.concat_tables(tables, promote_options="default"), tmp)
+    os.replace(tmp, target)
+    for p in day.glob("*.parquet"):
+        if p != target:
+            p.unlink()
+
+def read_run_log(log_csv: Path, columns: Optional[Iterable[str]] = None,
+                 filters: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+    """
+    Read run logs from the legacy CSV and the Parquet dataset, oldest first.
+    `filters` ({column: value}) and `columns` are pushed down to the Parquet scan;
+    filters on columns the log doesn't have are ignored.
+    """
+    columns = list(columns) if columns is not None else None
+    filters = filters or {}
+    frames = []
 
     if log_csv.exists():
-        try:
-            # try to read the log
-            prev = pd.read_csv(log_csv)
-        except pd.errors.EmptyDataError:
-            # file exists but it's empty or has no header
-            prev = pd.DataFrame(columns=df.columns)
-    else:
-        # log file doesn't exist yet
-        prev = pd.DataFrame(columns=df.columns)
-
-    # concat old and new rows
-    all_df = pd.concat([prev, df], ignore_index=True)
-
-    # save log
-    all_df.to_csv(log_csv, index=False)
+        df = pd.read_csv(log_csv, dtype=str, keep_default_na=False)
+        for k, v in filters.items():
+            if k in df.columns:
+                df = df[df[k] == v]
+        if columns is not None:
+            df = df[[c for c in columns if c in df.columns]]
+        frames.append(df)
+
+    d = run_log_dir(log_csv)
+    parts = _day_parts(d) if pa is not None else []
+    if parts:
+        # The explicit (sorted) path list keeps the scan in logged order; run_date
+        # is read back as the string it was written as, not inferred as a date.
+        factory = pads.FileSystemDatasetFactory(
+            pafs.LocalFileSystem(), [str(p) for p in parts], pads.ParquetFileFormat(),
+            pads.FileSystemFactoryOptions(
+                partition_base_dir=str(d),
+                partitioning=pads.partitioning(pa.schema([("run_date", pa.string())]), flavor="hive"),
+            ),
+        )
+        # days may carry different columns; unify so none get dropped
+        schema = factory.inspect()
+        ds = factory.finish(schema)
+        expr = None
+        for k, v in filters.items():
+            if k in schema.names:
+                e = pads.field(k) == v
+                expr = e if expr is None else expr & e
+        cols = [c for c in columns if c in schema.names] if columns is not None else None
+        frames.append(ds.to_table(columns=cols, filter=expr).to_pandas())
 
+    if not frames:
+        return pd.DataFrame(columns=columns or [])
+    df = pd.concat(frames, ignore_index=True)
+    order = [c for c in ("run_date", "run_time") if c in df.columns]
+    if order:
+        df = df.sort_values(order, kind="stable", ignore_index=True)
+    if "rows" in df.columns:
+        df["rows"] = pd.to_numeric(df["rows"], errors="coerce").astype("Int64")
+    return df
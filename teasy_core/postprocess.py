@@ -1,57 +1,77 @@
 from __future__ import annotations
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+import os
 import re
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlsplit
 import unicodedata
+from functools import lru_cache
+
+# Opt-in: TEASY_REGEX_ENGINE=regex compiles the date patterns with the PyPI `regex`
+# engine. It stays off by default because on our teaser-date samples it measured
+# slower than stdlib re. Patterns with \w/\b always use re: regex's word class also
+# covers combining marks and ZWJ/ZWNJ, so e.g. "πριν 3 ώρες\u200d" would stop
+# matching. (re2 is not an option: no lookahead, and its \b is ASCII-only.)
+_regex = None
+if os.getenv("TEASY_REGEX_ENGINE", "").lower() == "regex":
+    try:
+        import regex as _regex
+    except ImportError:
+        _regex = None
+
+_WORDISH_RE = re.compile(r"\\[wWbB]")
+
+def _date_re(pattern: str, flags: int = 0):
+    if _regex is not None and not _WORDISH_RE.search(pattern):
+        return _regex.compile(pattern, flags)
+    return re.compile(pattern, flags)
 
 # ------------------------------------------------------------
 # Date parsing helpers (comments in English, Greek tokens kept)
 # ------------------------------------------------------------
 # 20/09/2025 • 00:00 •   also accepts middle dot, dash, comma, or vertical bar
-RE_DDMMYYYY_BULLET_HHMM = re.compile(
-    r"""^\s*
+RE_DDMMYYYY_BULLET_HHMM = _date_re(
+    r"""
         (\d{1,2})[./-](\d{1,2})[./-](\d{2,4})     # DD/MM/YYYY
         \s*[-–—•\u00B7,|]\s*                      # dash/en/em dash/bullet/middle dot/comma/pipe
         (\d{1,2}):(\d{2})(?::(\d{2}))?            # HH:MM[:SS]
-        \s*(?:[•\u00B7|]\s*)?                     # optional trailing bullet/middle dot/pipe
+        .*                                        # anything after the time (bullet, label…) is ignored
     """, re.X
 )
 
 # 19/09/2025 - 20:00   (also accepts en/em dash and optional seconds)
-RE_DDMMYYYY_DASH_HHMM = re.compile(
-    r"""^\s*
+RE_DDMMYYYY_DASH_HHMM = _date_re(
+    r"""
         (\d{1,2})[./-](\d{1,2})[./-](\d{2,4})      # DD/MM/YYYY
         \s*[-–—]\s*                                 # dash with optional spaces
         (\d{1,2}):(\d{2})(?::(\d{2}))?              # HH:MM[:SS]
-        \s*$
     """, re.X
 )
 
 # 07:27 17/09/2025 or 07:2717/09/2025  (space optional)
-RE_HHMM_DDMMYYYY_COMPACT = re.compile(
-    r"^\s*(\d{1,2}):(\d{2})\s*(\d{1,2})/(\d{1,2})/(\d{4}|\d{2})\s*$"
+RE_HHMM_DDMMYYYY_COMPACT = _date_re(
+    r"(\d{1,2}):(\d{2})\s*(\d{1,2})/(\d{1,2})/(\d{4}|\d{2})"
 )
 
 # 19.09.25 13:41 or 19.09.2513:41  (space optional; year 2 or 4 digits)
 # use a lookahead to ensure year is followed by a time, so '25' doesn't eat the '13'
-RE_DDMMYYYY_HHMM_COMPACT = re.compile(
-    r"^\s*(\d{1,2})\.(\d{1,2})\.(\d{4}|\d{2})(?=\s*\d{1,2}:)\s*(\d{1,2}):(\d{2})(?::(\d{2}))?\s*$"
+RE_DDMMYYYY_HHMM_COMPACT = _date_re(
+    r"(\d{1,2})\.(\d{1,2})\.(\d{4}|\d{2})(?=\s*\d{1,2}:)\s*(\d{1,2}):(\d{2})(?::(\d{2}))?"
 )
 
 # Examples: "19/09/2025 10:10", "19-09-25 10:10", "19.09.2025 10:10:05"
-RE_DDMMYYYY_HHMM = re.compile(
-    r"^\s*(\d{1,2})[./-](\d{1,2})[./-](\d{2,4})\s+(\d{1,2}):(\d{2})(?::(\d{2}))?\s*$"
+RE_DDMMYYYY_HHMM = _date_re(
+    r"(\d{1,2})[./-](\d{1,2})[./-](\d{2,4})\s+(\d{1,2}):(\d{2})(?::(\d{2}))?"
 )
 
 # Example: "11:37 09/07"  -> assume current year
-RE_HHMM_DDMM = re.compile(r"^\s*(\d{1,2}):(\d{2})\s*(\d{2})/(\d{2})\s*$")
+RE_HHMM_DDMM = _date_re(r"(\d{1,2}):(\d{2})\s*(\d{2})/(\d{2})")
 
 # Examples: "28/09/2023", "28-09-23", "28.09.2023"
-RE_DDMMYYYY = re.compile(r"^\s*(\d{1,2})[./-](\d{1,2})[./-](\d{2,4})\s*$")
+RE_DDMMYYYY = _date_re(r"(\d{1,2})[./-](\d{1,2})[./-](\d{2,4})")
 
 # Example: "28/09" (assume current year)
-RE_DDMM = re.compile(r"^\s*(\d{1,2})[./-](\d{1,2})\s*$")
+RE_DDMM = _date_re(r"(\d{1,2})[./-](\d{1,2})")
 
 # Examples accepted (month token can be Greek or English):
 #   "19 Σεπ 2025 10:24"
@@ -59,36 +79,31 @@ RE_DDMM = re.compile(r"^\s*(\d{1,2})[./-](\d{1,2})\s*$")
 #   "19 Sep 2025 10:24"
 #   "19 Σεπ 10:24"  (no year -> assume current)
 #   "19 Σεπ 2025"   (no time)
-RE_DAY_MON_YEAR_TIME = re.compile(
+RE_DAY_MON_YEAR_TIME = _date_re(
     r"""(?ix)
-    ^\s*
     (?P<day>\d{1,2})
     (?:\s*,\s*|\s+)                                  # allow comma or space after day
     (?P<mon>[A-Za-zΑ-ΩΆΈΊΌΎΉΏα-ωάέίόύήώϊϋΐΰ.]+)      # month token (Greek or English)
     (?: (?:\s*,\s*|\s+) (?P<year>\d{2,4}) )?         # optional year (comma/space)
     (?: (?:\s*,\s*|\s+|\s*[-–—•\u00B7,|]\s*) (?P<hh>\d{1,2}):(?P<mm>\d{2})(?::(?P<ss>\d{2}))? )?  # optional time, accepts | • · dashes
-    \s*$
     """
 )
 
 # 07:00, 1 Σεπτεμβρίου 2025  (optionally with seconds and optional commas/spaces)
-RE_HHMM_DAY_MON_YEAR = re.compile(
+RE_HHMM_DAY_MON_YEAR = _date_re(
     r"""(?ix)
-    ^\s*
     (?P<hh>\d{1,2}):(?P<mm>\d{2})(?::(?P<ss>\d{2}))?   # time first
     (?:\s*,\s*|\s+)                                    # comma or space
     (?P<day>\d{1,2})
     (?:\s*,\s*|\s+)
     (?P<mon>[A-Za-zΑ-ΩΆΈΊΌΎΉΏα-ωάέίόύήώϊϋΐΰ.]+)
     (?:\s*,\s*|\s+)(?P<year>\d{2,4})?                  # year optional
-    \s*$
     """
 )
 
 # 07:00, Παρασκευή 1 Σεπτεμβρίου 2025  (time first, optional weekday)
-RE_HHMM_WD_DAY_MON_YEAR = re.compile(
+RE_HHMM_WD_DAY_MON_YEAR = _date_re(
     r"""(?ix)
-    ^\s*
     (?P<hh>\d{1,2}):(?P<mm>\d{2})(?::(?P<ss>\d{2}))?   # time first
     (?:\s*,\s*|\s+)                                    # comma or space
     (?:(?P<wd>[\w.\u0370-\u03FF\u1F00-\u1FFF]+)(?:\s*,\s*|\s+))?  # optional weekday (Greek/English), optional comma
@@ -96,53 +111,34 @@ RE_HHMM_WD_DAY_MON_YEAR = re.compile(
     (?:\s*,\s*|\s+)
     (?P<mon>[\w.\u0370-\u03FF\u1F00-\u1FFF]+)
     (?:\s*,\s*|\s+)(?P<year>\d{2,4})?                  # optional year
-    \s*$
     """
 )
 
-# "x ago" families (English)
-RE_EAGO = [
-    re.compile(r"(?i)\b(\d+)\s*seconds?\s*ago\b"),
-    re.compile(r"(?i)\b(\d+)\s*mins?\s*ago\b"),
-    re.compile(r"(?i)\b(\d+)\s*hours?\s*ago\b"),
-    re.compile(r"(?i)\b(\d+)\s*days?\s*ago\b"),
-    re.compile(r"(?i)\b(\d+)\s*weeks?\s*ago\b"),
-    re.compile(r"(?i)\b(\d+)\s*months?\s*ago\b"),
-    re.compile(r"(?i)\b(\d+)\s*years?\s*ago\b"),
-]
-
-# "x ago" families (Greek)
-RE_GAGO = [
-    # "πριν 12 δευτερόλεπτα" / "πριν 12 δευτ." / "sec" / "seconds"
-    re.compile(r"(?i)\bπριν(?:\s+από)?\s+(\d+)\s*(δευτερόλεπτα|δευτ\.?|sec|seconds?)\b"),
-    # "πριν 5 λεπτά" / "πριν 5 λεπτο" / "min" / "minutes"
-    re.compile(r"(?i)\bπριν(?:\s+από)?\s+(\d+)\s*(λεπτά|λεπτο|λεπτ\.?|min|minutes?)\b"),
-    # "πριν 3 ωρες" / "πριν 3 ώρα" / "πριν 3 ώρες" / "hour" / "hours"
-    re.compile(r"(?i)\bπριν(?:\s+από)?\s+(\d+)\s*(ωρες|ώρα|ώρες|hour|hours?)\b"),
-    # "πριν 2 ημέρες" / "πριν 2 μέρες" / "day" / "days"
-    re.compile(r"(?i)\bπριν(?:\s+από)?\s+(\d+)\s*(ημέρες|ημέρα|μέρες|μέρα|day|days?)\b"),
-    # "πριν 2 εβδομάδες" / "week" / "weeks"
-    re.compile(r"(?i)\bπριν(?:\s+από)?\s+(\d+)\s*(εβδομάδες|εβδομάδα|week|weeks?)\b"),
-    # "πριν 2 μήνες" / "πριν 2 μηνες" / "month" / "months"
-    re.compile(r"(?i)\bπριν(?:\s+από)?\s+(\d+)\s*(μήνες|μηνες|month|months?)\b"),
-    # "πριν 2 χρόνια" / "πριν 2 έτη" / "year" / "years"
-    re.compile(r"(?i)\bπριν(?:\s+από)?\s+(\d+)\s*(χρόνια|έτη|year|years?)\b"),
-]
-
-# “Bare” ποσότητες χωρίς το «πριν» (π.χ. "2 ημέρες", "2 εβδομάδες")
-RE_GBARE = [
-    re.compile(r"(?i)^\s*(\d+)\s*(δευτερόλεπτα|δευτ\.?|sec|seconds?)\s*$"),
-    re.compile(r"(?i)^\s*(\d+)\s*(λεπτά|λεπτο|λεπτ\.?|min|minutes?)\s*$"),
-    re.compile(r"(?i)^\s*(\d+)\s*(ωρες|ώρα|ώρες|hour|hours?)\s*$"),
-    re.compile(r"(?i)^\s*(\d+)\s*(ημέρες|ημέρα|μέρες|μέρα|day|days?)\s*$"),
-    re.compile(r"(?i)^\s*(\d+)\s*(εβδομάδες|εβδομάδα|week|weeks?)\s*$"),
-    re.compile(r"(?i)^\s*(\d+)\s*(μήνες|μηνες|month|months?)\s*$"),
-    re.compile(r"(?i)^\s*(\d+)\s*(χρόνια|έτη|year|years?)\s*$"),
-]
+# "x ago" unit tokens, in the order of _AGO_UNITS (seconds … years)
+_EAGO_UNITS = ("seconds?", "mins?", "hours?", "days?", "weeks?", "months?", "years?")
+_GAGO_UNITS = (
+    r"δευτερόλεπτα|δευτ\.?|sec|seconds?",         # "12 δευτερόλεπτα" / "12 δευτ." / "sec" / "seconds"
+    r"λεπτά|λεπτο|λεπτ\.?|min|minutes?",          # "5 λεπτά" / "5 λεπτο" / "min" / "minutes"
+    r"ωρες|ώρα|ώρες|hour|hours?",                 # "3 ωρες" / "3 ώρα" / "3 ώρες" / "hour" / "hours"
+    r"ημέρες|ημέρα|μέρες|μέρα|day|days?",         # "2 ημέρες" / "2 μέρες" / "day" / "days"
+    r"εβδομάδες|εβδομάδα|week|weeks?",            # "2 εβδομάδες" / "week" / "weeks"
+    r"μήνες|μηνες|month|months?",                 # "2 μήνες" / "2 μηνες" / "month" / "months"
+    r"χρόνια|έτη|year|years?",                    # "2 χρόνια" / "2 έτη" / "year" / "years"
+)
+
+def _ago_re(template: str, units: Tuple[str, ...]):
+    # One alternation per family; the named group u<i> that matched gives the unit
+    return _date_re(template.replace("UNIT", "|".join(f"(?P<u{i}>{u})" for i, u in enumerate(units))))
+
+# "x ago" families: English, Greek ("πριν (από) X ..."), and
+# “bare” ποσότητες χωρίς το «πριν» (π.χ. "2 ημέρες", "2 εβδομάδες")
+RE_EAGO = _ago_re(r"(?i)\b(?P<val>\d+)\s*(?:UNIT)\s*ago\b", _EAGO_UNITS)
+RE_GAGO = _ago_re(r"(?i)\bπριν(?:\s+από)?\s+(?P<val>\d+)\s*(?:UNIT)\b", _GAGO_UNITS)
+RE_GBARE = _ago_re(r"(?i)(?P<val>\d+)\s*(?:UNIT)", _GAGO_UNITS)
 
 # Examples: "11:20", "11:20:05", "ώρα 11:20", "11:20 πμ", "11:20 μμ", "11:20 pm", "11:20,"
-RE_HHMM_ONLY = re.compile(
-    r"^\s*(?:ώρα\s*)?(\d{1,2}):(\d{2})(?::(\d{2}))?\s*(πμ|μμ|am|pm|AM|PM)?\s*[.,;·]?\s*$",
+RE_HHMM_ONLY = _date_re(
+    r"(?:ώρα\s*)?(\d{1,2}):(\d{2})(?::(\d{2}))?\s*(πμ|μμ|am|pm|AM|PM)?\s*[.,;·]?",
     re.IGNORECASE
 )
 
@@ -186,346 +182,442 @@ MONTHS: Dict[str, int] = {
     "dec": 12, "december": 12,
 }
 
-def _preclean(text: str) -> str:
-    # Normalize Unicode (e.g., fullwidth digits/punct to ASCII)
-    t = unicodedata.normalize("NFKC", text)
-    # Normalize common “weird” spaces used on news sites
-    t = t.replace("\u00A0", " ").replace("\u202F", " ").replace("\u2009", " ")
-    # Normalize comma lookalikes to ASCII comma
-    t = t.replace("،", ",").replace("，", ",")
-    # Collapse repeated whitespace and trim
-    t = re.sub(r"\s+", " ", t).strip(" \t\r\n,")
-    return t
+# Common “weird” spaces used on news sites, and comma lookalikes, in one table
+_PRECLEAN_TRANS = str.maketrans({"\u00A0": " ", "\u202F": " ", "\u2009": " ", "،": ",", "，": ","})
 
-def _month_to_num(token: str) -> Optional[int]:
-    if not token:
-        return None
+def _preclean(text: str) -> str:
+    if text.isascii():
+        # NFKC and the lookalike table are no-ops here, and printable ASCII with no
+        # double space has no whitespace run left to collapse
+        t = text if text.isprintable() and "  " not in text else _WS_RE.sub(" ", text)
+    else:
+        # Normalize Unicode (e.g., fullwidth digits/punct to ASCII), then collapse repeated whitespace
+        t = _WS_RE.sub(" ", unicodedata.normalize("NFKC", text).translate(_PRECLEAN_TRANS))
+    # Trim
+    return t.strip(" \t\r\n,")
+
+@lru_cache(maxsize=512)
+def _month_to_num_slow(token: str) -> Optional[int]:
     t = token.strip().strip(".").lower().translate(_G_ACCENTS)
     # normalize diaeresis variants to base vowels
     t = t.replace("ϊ","ι").replace("ΐ","ι").replace("ϋ","υ").replace("ΰ","υ")
     return MONTHS.get(t)
 
-def _apply_ago(now, text: str):
-    t = text.strip()
+def _month_forms() -> Dict[str, int]:
+    """Month tokens as they appear on pages (accented, Title/UPPER case, trailing dot) -> month."""
+    tonos = {"α": "ά", "ε": "έ", "ι": "ί", "ο": "ό", "υ": "ύ", "η": "ή", "ω": "ώ"}
+    bases = set(MONTHS)
+    for k in MONTHS:
+        # one accented vowel at a time covers the real spelling (Σεπτεμβρίου, Μαΐου, ...)
+        for i, c in enumerate(k):
+            if c in tonos:
+                bases.add(k[:i] + tonos[c] + k[i + 1:])
+            if c == "ι":
+                bases.add(k[:i] + "ϊ" + k[i + 1:])
+                bases.add(k[:i] + "ΐ" + k[i + 1:])
+    forms: Dict[str, int] = {}
+    for b in bases:
+        for f in (b, b.capitalize(), b.upper()):
+            for v in (f, f + "."):
+                num = _month_to_num_slow(v)
+                if num:
+                    forms[v] = num
+    return forms
+
+_MONTH_FORMS = _month_forms()
 
-    # Αγγλικά "X ... ago"
-    for i, rex in enumerate(RE_EAGO):
-        m = rex.search(t)
-        if m:
-            val = int(m.group(1))
-            if i == 0: dt = now - timedelta(seconds=val)
-            elif i == 1: dt = now - timedelta(minutes=val)
-            elif i == 2: dt = now - timedelta(hours=val)
-            elif i == 3: dt = now - timedelta(days=val)
-            elif i == 4: dt = now - timedelta(weeks=val)
-            elif i == 5: dt = now - timedelta(days=val*30)
-            elif i == 6: dt = now - timedelta(days=val*365)
-            return dt.strftime("%Y-%m-%dT%H:%M")
-
-    # Ελληνικά "Πριν (από) X ..."
-    for i, rex in enumerate(RE_GAGO):
-        m = rex.search(t)
-        if m:
-            val = int(m.group(1))
-            if i == 0: dt = now - timedelta(seconds=val)
-            elif i == 1: dt = now - timedelta(minutes=val)
-            elif i == 2: dt = now - timedelta(hours=val)
-            elif i == 3: dt = now - timedelta(days=val)
-            elif i == 4: dt = now - timedelta(weeks=val)
-            elif i == 5: dt = now - timedelta(days=val*30)
-            elif i == 6: dt = now - timedelta(days=val*365)
-            return dt.strftime("%Y-%m-%dT%H:%M")
+def _month_to_num(token: str) -> Optional[int]:
+    if not token:
+        return None
+    # precomputed surface forms answer the common case with one dict probe
+    num = _MONTH_FORMS.get(token)
+    if num is not None:
+        return num
+    return _month_to_num_slow(token)
+
+_AGO_UNITS = (
+    timedelta(seconds=1), timedelta(minutes=1), timedelta(hours=1), timedelta(days=1),
+    timedelta(weeks=1), timedelta(days=30), timedelta(days=365),
+)
 
-    # Ελληνικά/Αγγλικά "X ημέρες/εβδομάδες/..."  (χωρίς "πριν")
-    for i, rex in enumerate(RE_GBARE):
-        m = rex.search(t)
-        if m:
-            val = int(m.group(1))
-            if i == 0: dt = now - timedelta(seconds=val)
-            elif i == 1: dt = now - timedelta(minutes=val)
-            elif i == 2: dt = now - timedelta(hours=val)
-            elif i == 3: dt = now - timedelta(days=val)
-            elif i == 4: dt = now - timedelta(weeks=val)
-            elif i == 5: dt = now - timedelta(days=val*30)
-            elif i == 6: dt = now - timedelta(days=val*365)
-            return dt.strftime("%Y-%m-%dT%H:%M")
+def _ago_delta(text: str) -> Optional[timedelta]:
+    """How far back an 'x ago' form points, or None if the text isn't one."""
+    t = text.strip()
 
+    # Αγγλικά "X ... ago", Ελληνικά "Πριν (από) X ...",
+    # Ελληνικά/Αγγλικά "X ημέρες/εβδομάδες/..."  (χωρίς "πριν")
+    for rex in (RE_EAGO, RE_GAGO):
+        # The per-unit patterns used to be tried seconds-first, so when a string
+        # holds several matches the smallest unit still wins.
+        best = None
+        for m in rex.finditer(t):
+            i = int(m.lastgroup[1:])
+            if best is None or i < best[0]:
+                best = (i, m)
+        if best is not None:
+            i, m = best
+            return int(m.group("val")) * _AGO_UNITS[i]
+    # the bare form has to be the whole text
+    m = RE_GBARE.fullmatch(t)
+    if m:
+        return int(m.group("val")) * _AGO_UNITS[int(m.lastgroup[1:])]
     return None
 
-def normalize_date(text: Optional[str]) -> Optional[str]:
-    """
-    Normalize teaser-date shapes to ISO-like strings:
-      - '19 Σεπ 2025 10:24' -> '2025-09-19T10:24'
-      - '19 Σεπ 2025'      -> '2025-09-19'
-      - '19 Σεπ 10:24'     -> '<current-year>-09-19T10:24'
-      - '11:37 09/07'      -> '<current-year>-07-09T11:37'
-      - '28/09/2023'       -> '2023-09-28'
-      - '28/09'            -> '<current-year>-09-28'
-      - Greek/English 'x ago' like 'πριν 3 ώρες' / '3 hours ago'
-    Returns the original text if no parser matched.
-    """
-    if not text:
-        return None
-    t = _preclean(text)
-    now = datetime.now()
+# Returned by a branch parser whose regex matched but whose month token isn't a
+# known month, so the next candidate parser should be tried.
+_SKIP = object()
 
-    # Remove trailing category labels like "• ΠΟΛΙΤΙΚΗ", "• ΚΟΣΜΟΣ", etc.
-    # Keep only the part before the first Greek/English all-caps word.
-    # Example: "24/11/2025 • 14:30 • ΠΟΛΙΤΙΚΗ" → "24/11/2025 • 14:30"
-    t = re.split(r"\s*[•|,-]\s*[A-Zα-ωΑ-ΩΆΈΉΊΌΎΏάέήίόύώ]{3,}\s*$", t)[0].strip()
+def _year4(yy: int) -> int:
+    return 2000 + yy if yy < 100 else yy
 
-    # "x ago" forms
-    ago = _apply_ago(now, t)
-    if ago:
-        return ago
+_MONTH_DAYS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
 
-        # bare time only: "HH:MM[:SS]" -> assume today
-    m = RE_HHMM_ONLY.match(t)
-    if m:
-        hh_s, mm_s, ss_s, ap = m.groups()
-        hh, mi = int(hh_s), int(mm_s)
-        ss = int(ss_s) if ss_s else 0
-        if ap:
-            ap_norm = ap.lower()
-            if ap_norm in ("πμ", "am"):
-                if hh == 12:
-                    hh = 0
-            elif ap_norm in ("μμ", "pm"):
-                if hh < 12:
-                    hh += 12
-        try:
-            dt = datetime(year=now.year, month=now.month, day=now.day,
-                          hour=hh, minute=mi, second=ss)
-            return dt.strftime("%Y-%m-%dT%H:%M")
-        except ValueError:
-            return None
-
-    # "20/09/2025 • 00:00 •"
-    m = RE_DDMMYYYY_BULLET_HHMM.match(t)
-    if m:
-        dd_s, MM_s, yy_s, hh_s, mm_s, ss_s = m.groups()
-        dd, MM = int(dd_s), int(MM_s)
-        yy = int(yy_s)
-        if yy < 100:
-            yy = 2000 + yy
-        hh, mi = int(hh_s), int(mm_s)
-        ss = int(ss_s) if ss_s else 0
-        try:
-            dt = datetime(year=yy, month=MM, day=dd, hour=hh, minute=mi, second=ss)
-            return dt.strftime("%Y-%m-%dT%H:%M")
-        except ValueError:
-            return None
-
-    # "19/09/2025 - 20:00" (supports ., -, / separators; en/em dash; optional seconds)
-    m = RE_DDMMYYYY_DASH_HHMM.match(t)
-    if m:
-        dd_s, MM_s, yy_s, hh_s, mm_s, ss_s = m.groups()
-        dd, MM = int(dd_s), int(MM_s)
-        yy = int(yy_s)
-        if yy < 100:
-            yy = 2000 + yy
-        hh, mi = int(hh_s), int(mm_s)
-        ss = int(ss_s) if ss_s else 0
-        try:
-            dt = datetime(year=yy, month=MM, day=dd, hour=hh, minute=mi, second=ss)
-            return dt.strftime("%Y-%m-%dT%H:%M")
-        except ValueError:
-            return None
-
-    # "19.09.25 13:41" or "19.09.2513:41" (also supports 4-digit year and optional seconds)
-    m = RE_DDMMYYYY_HHMM_COMPACT.match(t)
-    if m:
-        dd_s, MM_s, yy_s, hh_s, mm_s, ss_s = m.groups()
-        dd, MM = int(dd_s), int(MM_s)
-        yy = int(yy_s)
-        if yy < 100:  # interpret 2-digit year as 2000+YY
-            yy = 2000 + yy
-        hh, mi = int(hh_s), int(mm_s)
-        ss = int(ss_s) if ss_s else 0
-        try:
-            dt = datetime(year=yy, month=MM, day=dd, hour=hh, minute=mi, second=ss)
-            return dt.strftime("%Y-%m-%dT%H:%M")
-        except ValueError:
-            return None
+def _valid_date(yy: int, MM: int, dd: int) -> bool:
+    # same bounds datetime() enforces, without building one
+    if not (1 <= yy <= 9999 and 1 <= MM <= 12 and dd >= 1):
+        return False
+    if MM == 2 and yy % 4 == 0 and (yy % 100 != 0 or yy % 400 == 0):
+        return dd <= 29
+    return dd <= _MONTH_DAYS[MM - 1]
 
-    # "07:27 17/09/2025" or "07:2717/09/2025"
-    m = RE_HHMM_DDMMYYYY_COMPACT.match(t)
-    if m:
-        hh_s, mm_s, dd_s, MM_s, yy_s = m.groups()
-        hh, mm = int(hh_s), int(mm_s)
-        dd, MM = int(dd_s), int(MM_s)
-        yy = int(yy_s)
-        if yy < 100:
-            yy = 2000 + yy
-        try:
-            dt = datetime(year=yy, month=MM, day=dd, hour=hh, minute=mm)
-            return dt.strftime("%Y-%m-%dT%H:%M")
-        except ValueError:
-            return None
-
-    # 07:00, Παρασκευή 1 Σεπτεμβρίου 2025  (time first, optional weekday)
-    m = RE_HHMM_WD_DAY_MON_YEAR.match(t)
-    if m:
-        hh = int(m.group("hh"))
-        mi = int(m.group("mm"))
-        ss = m.group("ss")
-        dd = int(m.group("day"))
-        mon_tok = m.group("mon")
-        year_s = m.group("year")
-        mon = _month_to_num(mon_tok)
-        if mon:
-            year = int(year_s) if year_s else now.year
-            if year < 100:
-                year = 2000 + year
-            try:
-                dt = datetime(
-                    year=year, month=mon, day=dd,
-                    hour=hh, minute=mi, second=(int(ss) if ss else 0)
-                )
-                return dt.strftime("%Y-%m-%dT%H:%M")
-            except ValueError:
-                return None
-
-    # 07:00, 1 Σεπτεμβρίου 2025  (time first)
-    m = RE_HHMM_DAY_MON_YEAR.match(t)
-    if m:
-        hh = int(m.group("hh"))
-        mi = int(m.group("mm"))
-        ss = m.group("ss")
-        dd = int(m.group("day"))
-        mon_tok = m.group("mon")
-        year_s = m.group("year")
-        mon = _month_to_num(mon_tok)
-        if mon:
-            year = int(year_s) if year_s else now.year
-            if year < 100:
-                year = 2000 + year
-            try:
-                dt = datetime(year=year, month=mon, day=dd, hour=hh, minute=mi, second=(int(ss) if ss else 0))
-                return dt.strftime("%Y-%m-%dT%H:%M")
-            except ValueError:
-                return None
-
-    # 19/09/2025 10:10 (optionally with seconds)
-    m = RE_DDMMYYYY_HHMM.match(t)
-    if m:
-        dd, MM, yy, hh, mi, ss = m.groups()
-        dd, MM = int(dd), int(MM)
-        yy = int(yy)
-        if yy < 100:
-            yy = 2000 + yy
-        hh = int(hh); mi = int(mi); ss = int(ss) if ss else 0
-        try:
-            dt = datetime(year=yy, month=MM, day=dd, hour=hh, minute=mi, second=ss)
-            return dt.strftime("%Y-%m-%dT%H:%M")
-        except ValueError:
-            return None
+def _iso_date(yy: int, MM: int, dd: int) -> Optional[str]:
+    return f"{yy:04d}-{MM:02d}-{dd:02d}" if _valid_date(yy, MM, dd) else None
+
+def _iso_dt(yy: int, MM: int, dd: int, hh: int, mi: int, ss: int = 0) -> Optional[str]:
+    if _valid_date(yy, MM, dd) and 0 <= hh <= 23 and 0 <= mi <= 59 and 0 <= ss <= 59:
+        return f"{yy:04d}-{MM:02d}-{dd:02d}T{hh:02d}:{mi:02d}"
+    return None
 
+def _p_hhmm_only(m, now):
+    # bare time only: "HH:MM[:SS]" -> assume today
+    hh_s, mm_s, ss_s, ap = m.groups()
+    hh, mi = int(hh_s), int(mm_s)
+    ss = int(ss_s) if ss_s else 0
+    if ap:
+        ap_norm = ap.lower()
+        if ap_norm in ("πμ", "am"):
+            if hh == 12:
+                hh = 0
+        elif ap_norm in ("μμ", "pm"):
+            if hh < 12:
+                hh += 12
+    return _iso_dt(now.year, now.month, now.day, hh, mi, ss)
+
+def _p_ddmmyyyy_hhmmss(m, now):
+    # "20/09/2025 • 00:00 •", "19/09/2025 - 20:00", "19.09.25 13:41", "19/09/2025 10:10"
+    dd_s, MM_s, yy_s, hh_s, mm_s, ss_s = m.groups()
+    return _iso_dt(_year4(int(yy_s)), int(MM_s), int(dd_s), int(hh_s), int(mm_s), int(ss_s) if ss_s else 0)
+
+def _p_hhmm_ddmmyyyy(m, now):
+    # "07:27 17/09/2025" or "07:2717/09/2025"
+    hh_s, mm_s, dd_s, MM_s, yy_s = m.groups()
+    return _iso_dt(_year4(int(yy_s)), int(MM_s), int(dd_s), int(hh_s), int(mm_s))
+
+def _p_hhmm_day_mon_year(m, now):
+    # 07:00, [Παρασκευή] 1 Σεπτεμβρίου 2025  (time first)
+    mon = _month_to_num(m.group("mon"))
+    if not mon:
+        return _SKIP
+    year_s = m.group("year")
+    ss = m.group("ss")
+    return _iso_dt(_year4(int(year_s) if year_s else now.year), mon, int(m.group("day")),
+                   int(m.group("hh")), int(m.group("mm")), int(ss) if ss else 0)
+
+def _p_hhmm_ddmm(m, now):
     # 11:37 09/07
-    m = RE_HHMM_DDMM.match(t)
-    if m:
-        hh, mm, dd, MM = map(int, m.groups())
-        try:
-            dt = datetime(year=now.year, month=MM, day=dd, hour=hh, minute=mm)
-            return dt.strftime("%Y-%m-%dT%H:%M")
-        except ValueError:
-            return None
+    hh, mm, dd, MM = map(int, m.groups())
+    return _iso_dt(now.year, MM, dd, hh, mm)
 
+def _p_dd_mmyyyy(m, now):
     # Special malformed form: "DD/MMYYYY" → treat "MMYYYY" as month+year
-    m = re.match(r"^\s*(\d{1,2})/(\d{2})(\d{4})\s*$", t)
-    if m:
-        dd_s, MM_s, yy_s = m.groups()
-        dd, MM, yy = int(dd_s), int(MM_s), int(yy_s)
-        try:
-            dt = datetime(year=yy, month=MM, day=dd)
-            return dt.strftime("%Y-%m-%d")
-        except ValueError:
-            return None
+    dd_s, MM_s, yy_s = m.groups()
+    return _iso_date(int(yy_s), int(MM_s), int(dd_s))
 
+def _p_ddmmyyyy(m, now):
     # 28/09/2023
-    m = RE_DDMMYYYY.match(t)
-    if m:
-        dd, MM, yy = m.groups()
-        dd, MM = int(dd), int(MM)
-        yy = int(yy)
-        if yy < 100:
-            yy = 2000 + yy
-        try:
-            dt = datetime(year=yy, month=MM, day=dd)
-            return dt.strftime("%Y-%m-%d")
-        except ValueError:
-            return None
+    dd, MM, yy = m.groups()
+    return _iso_date(_year4(int(yy)), int(MM), int(dd))
 
+def _p_ddmm(m, now):
     # 28/09
-    m = RE_DDMM.match(t)
-    if m:
-        dd, MM = map(int, m.groups())
-        try:
-            dt = datetime(year=now.year, month=MM, day=dd)
-            return dt.strftime("%Y-%m-%d")
-        except ValueError:
-            return None
+    dd, MM = map(int, m.groups())
+    return _iso_date(now.year, MM, dd)
 
+def _p_day_mon_year_time(m, now):
     # Day Mon [Year] [HH:MM[:SS]]
-    m = RE_DAY_MON_YEAR_TIME.match(t)
-    if m:
-        dd = int(m.group("day"))
-        mon_tok = m.group("mon")
-        year_s = m.group("year")
-        hh = m.group("hh")
-        mm = m.group("mm")
-        ss = m.group("ss")
-        mon = _month_to_num(mon_tok)
-        if mon:
-            year = int(year_s) if year_s else now.year
-            if year < 100:
-                year = 2000 + year
-            try:
-                if hh and mm:
-                    h = int(hh); mi = int(mm); s = int(ss) if ss else 0
-                    dt = datetime(year=year, month=mon, day=dd, hour=h, minute=mi, second=s)
-                    return dt.strftime("%Y-%m-%dT%H:%M")
-                else:
-                    dt = datetime(year=year, month=mon, day=dd)
-                    return dt.strftime("%Y-%m-%d")
-            except ValueError:
-                return None
+    mon = _month_to_num(m.group("mon"))
+    if not mon:
+        return _SKIP
+    year_s = m.group("year")
+    hh, mm, ss = m.group("hh"), m.group("mm"), m.group("ss")
+    year = _year4(int(year_s) if year_s else now.year)
+    if hh and mm:
+        return _iso_dt(year, mon, int(m.group("day")), int(hh), int(mm), int(ss) if ss else 0)
+    return _iso_date(year, mon, int(m.group("day")))
+
+RE_DD_MMYYYY = _date_re(r"(\d{1,2})/(\d{2})(\d{4})")
+
+# Shape classes for _classify(); each maps to the only parsers that can match that shape.
+# Every numeric pattern starts with a digit and, apart from the bullet form (which
+# ignores whatever follows the time), rejects letters; the month-name patterns need a letter for the month.
+_K_NONE, _K_TIME_ONLY, _K_NUM_TIME, _K_TEXT_TIME, _K_NUM_DATE, _K_TEXT_DATE = range(6)
+
+_PARSERS = {
+    _K_NONE: (),
+    _K_TIME_ONLY: (
+        (RE_HHMM_ONLY, _p_hhmm_only),
+    ),
+    _K_NUM_TIME: (
+        (RE_HHMM_ONLY, _p_hhmm_only),
+        (RE_DDMMYYYY_BULLET_HHMM, _p_ddmmyyyy_hhmmss),
+        (RE_DDMMYYYY_DASH_HHMM, _p_ddmmyyyy_hhmmss),
+        (RE_DDMMYYYY_HHMM_COMPACT, _p_ddmmyyyy_hhmmss),
+        (RE_HHMM_DDMMYYYY_COMPACT, _p_hhmm_ddmmyyyy),
+        (RE_DDMMYYYY_HHMM, _p_ddmmyyyy_hhmmss),
+        (RE_HHMM_DDMM, _p_hhmm_ddmm),
+    ),
+    _K_TEXT_TIME: (
+        (RE_HHMM_ONLY, _p_hhmm_only),
+        (RE_DDMMYYYY_BULLET_HHMM, _p_ddmmyyyy_hhmmss),
+        (RE_HHMM_WD_DAY_MON_YEAR, _p_hhmm_day_mon_year),
+        (RE_HHMM_DAY_MON_YEAR, _p_hhmm_day_mon_year),
+        (RE_DAY_MON_YEAR_TIME, _p_day_mon_year_time),
+    ),
+    _K_NUM_DATE: (
+        (RE_DD_MMYYYY, _p_dd_mmyyyy),
+        (RE_DDMMYYYY, _p_ddmmyyyy),
+        (RE_DDMM, _p_ddmm),
+    ),
+    _K_TEXT_DATE: (
+        (RE_DAY_MON_YEAR_TIME, _p_day_mon_year_time),
+    ),
+}
+
+class _AltMatch:
+    """View of one alternative inside a master-regex match, with the re.Match API the parsers use."""
+    __slots__ = ("m", "start", "n", "prefix")
+
+    def __init__(self, m, start: int, n: int, prefix: str):
+        self.m, self.start, self.n, self.prefix = m, start, n, prefix
+
+    def groups(self):
+        return self.m.groups()[self.start:self.start + self.n]
+
+    def group(self, name: str):
+        return self.m.group(self.prefix + name)
+
+def _build_master(parsers):
+    """
+    Fold a bucket's patterns into one alternation, each under its own named group
+    (its named subgroups get a per-alternative prefix). Alternatives are tried left
+    to right, so the first one that matches is the same one the sequential loop would pick.
+    """
+    parts = []
+    for i, (rex, _) in enumerate(parsers):
+        body = re.sub(r"^\(\?[a-zA-Z]+\)", "", rex.pattern)  # inline flags live in rex.flags
+        body = body.replace("(?P<", f"(?P<a{i}_")
+        flags = ("i" if rex.flags & re.IGNORECASE else "") + ("x" if rex.flags & re.VERBOSE else "")
+        # newline before ')' so a trailing verbose-mode comment can't swallow it
+        if "x" in flags:
+            body += "\n"
+        parts.append(f"(?P<a{i}>(?{flags}:{body}))" if flags else f"(?P<a{i}>{body})")
+    master = _date_re("|".join(parts))
+    # per alternative: (index into m.groups() where its own groups start, group count, name prefix)
+    layout = {f"a{i}": (master.groupindex[f"a{i}"], rex.groups, f"a{i}_") for i, (rex, _) in enumerate(parsers)}
+    return master, layout
+
+_MASTERS = {k: _build_master(v) for k, v in _PARSERS.items() if v}
+
+def _classify(t: str) -> int:
+    has_colon = ":" in t
+    if not t[:1].isdigit():
+        # only the bare-time form ("ώρα 11:20") may start with a non-digit
+        return _K_TIME_ONLY if has_colon else _K_NONE
+    has_alpha = any(c.isalpha() for c in t)
+    if has_colon:
+        return _K_TEXT_TIME if has_alpha else _K_NUM_TIME
+    return _K_TEXT_DATE if has_alpha else _K_NUM_DATE
+
+def _digits(t: str, *spans) -> bool:
+    # str.isdigit() scans each slice in C; _fast_parse only calls this on ASCII
+    # text, so it means 0-9 here (other digits are left to the regexes)
+    return all(t[a:b].isdigit() for a, b in spans)
+
+def _fast_parse(t: str, now):
+    """
+    Index-based scanner for the shapes most teaser dates come in:
+      'HH:MM' / 'H:MM', 'HH:MM DD/MM', 'DD/MM/YY HH:MM', 'DD/MM/YYYY HH:MM'
+    (date separators '/', '.', '-'). Returns _SKIP for anything else so the
+    regex parsers take over; results match what those parsers would return.
+    """
+    n = len(t)
+    if not t.isascii():
+        return _SKIP  # every shape handled here is plain ASCII
+    if n == 5 and t[2] == ":" and _digits(t, (0, 2), (3, 5)):
+        hh, mi, dd, MM, yy = int(t[0:2]), int(t[3:5]), now.day, now.month, now.year
+    elif n == 4 and t[1] == ":" and _digits(t, (0, 1), (2, 4)):
+        hh, mi, dd, MM, yy = int(t[0]), int(t[2:4]), now.day, now.month, now.year
+    elif n == 11 and t[2] == ":" and t[5] == " " and t[8] == "/" and _digits(t, (0, 2), (3, 5), (6, 8), (9, 11)):
+        hh, mi, dd, MM, yy = int(t[0:2]), int(t[3:5]), int(t[6:8]), int(t[9:11]), now.year
+    elif n in (14, 16) and t[2] in "/.-" and t[5] in "/.-" and t[n - 6] == " " and t[n - 3] == ":" \
+            and _digits(t, (0, 2), (3, 5), (6, n - 6), (n - 5, n - 3), (n - 2, n)):
+        dd, MM, yy = int(t[0:2]), int(t[3:5]), _year4(int(t[6:n - 6]))
+        hh, mi = int(t[n - 5:n - 3]), int(t[n - 2:n])
+    else:
+        return _SKIP
+    return _iso_dt(yy, MM, dd, hh, mi)
+
+@lru_cache(maxsize=4096)
+def _prepare_date(text: str):
+    """Clean the raw text once; returns (cleaned text, 'x ago' offset or None)."""
+    t = _preclean(text)
+    # Remove trailing category labels like "• ΠΟΛΙΤΙΚΗ", "• ΚΟΣΜΟΣ", etc.
+    # Keep only the part before the first Greek/English all-caps word.
+    # Example: "24/11/2025 • 14:30 • ΠΟΛΙΤΙΚΗ" → "24/11/2025 • 14:30"
+    t = re.split(r"\s*[•|,-]\s*[A-Zα-ωΑ-ΩΆΈΉΊΌΎΏάέήίόύώ]{3,}\s*$", t)[0].strip()
+    return t, _ago_delta(t)
+
+@lru_cache(maxsize=4096)
+def _parse_absolute(t: str, today) -> Optional[str]:
+    """All non-'ago' forms; they only depend on the text and today's date, so results are cached."""
+    # Common fixed-layout shapes don't need any regex
+    res = _fast_parse(t, today)
+    if res is not _SKIP:
+        return res
+
+    # One pass of this shape's master regex finds the first parser whose pattern matches
+    kind = _classify(t)
+    if kind in _MASTERS:
+        master, layout = _MASTERS[kind]
+        m = master.fullmatch(t)
+        if m:
+            i = int(m.lastgroup[1:])
+            parsers = _PARSERS[kind]
+            res = parsers[i][1](_AltMatch(m, *layout[m.lastgroup]), today)
+            if res is not _SKIP:
+                return res
+            # unknown month token: keep going with the lower-priority parsers
+            for rex, parse in parsers[i + 1:]:
+                m = rex.fullmatch(t)
+                if m:
+                    res = parse(m, today)
+                    if res is not _SKIP:
+                        return res
 
     # Fallback: return original
     return t
 
+def normalize_date(text: Optional[str], *, now: Optional[datetime] = None) -> Optional[str]:
+    """
+    Normalize teaser-date shapes to ISO-like strings:
+      - '19 Σεπ 2025 10:24' -> '2025-09-19T10:24'
+      - '19 Σεπ 2025'      -> '2025-09-19'
+      - '19 Σεπ 10:24'     -> '<current-year>-09-19T10:24'
+      - '11:37 09/07'      -> '<current-year>-07-09T11:37'
+      - '28/09/2023'       -> '2023-09-28'
+      - '28/09'            -> '<current-year>-09-28'
+      - Greek/English 'x ago' like 'πριν 3 ώρες' / '3 hours ago'
+    Returns the original text if no parser matched.
+    `now` anchors relative forms; defaults to datetime.now().
+    """
+    if not text:
+        return None
+    now = now or datetime.now()
+    t, ago = _prepare_date(text)
+
+    # "x ago" forms depend on the current time, so only the offset is cached
+    if ago is not None:
+        dt = now - ago
+        return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}T{dt.hour:02d}:{dt.minute:02d}"
+    return _parse_absolute(t, now.date())
+
 REQUIRED_COLS = ["title","url","date","summary","section"]
 
 _WS_RE = re.compile(r"\s+")
 _ZW_RE = re.compile(r"[\u200B\u200C\u200D\uFEFF]")  # zero-width chars
+_PUNCT_SPACE_RE = re.compile(r"\s+(?=[,.;:!?])")  # space before punctuation; lookahead, no backreference
 
 def tidy_text(s):
     if s is None:
         return None
-    t = str(s)
-    # Normalize non-breaking space & zero-width stuff
-    t = t.replace("\xa0", " ")
-    t = _ZW_RE.sub("", t)
-    # Collapse all whitespace runs to single spaces
-    t = _WS_RE.sub(" ", t).strip()
+    return _tidy_str(str(s))
+
+@lru_cache(maxsize=4096)
+def _tidy_str(t: str) -> str:
+    if t.isascii():
+        # no non-breaking/zero-width chars possible; only collapse when there's a run
+        if not t.isprintable() or "  " in t:
+            t = _WS_RE.sub(" ", t)
+        t = t.strip()
+    else:
+        # Normalize non-breaking space & zero-width stuff
+        t = t.replace("\xa0", " ")
+        t = _ZW_RE.sub("", t)
+        # Collapse all whitespace runs to single spaces
+        t = _WS_RE.sub(" ", t).strip()
     # Optional light punctuation spacing fixes
-    t = re.sub(r"\s+([,.;:!?])", r"\1", t)
+    t = _PUNCT_SPACE_RE.sub("", t)
     return t
 
+def _root_prefix(base_url: str) -> Optional[str]:
+    """'https://host' for an http(s) base, so root-relative links can skip urljoin()."""
+    parts = urlsplit(base_url)
+    if parts.scheme in ("http", "https") and parts.netloc:
+        return f"{parts.scheme}://{parts.netloc}"
+    return None
+
+def _join_root(prefix: str, u: str) -> Optional[str]:
+    # Plain '/path[?query][#frag]' links only; anything urljoin() would rewrite
+    # (dot segments, '//' runs, ';params', empty '?'/'#', tabs/newlines) returns None.
+    if u[:1] != "/" or u[1:2] == "/" or u[-1] in "?#" or "?#" in u:
+        return None
+    path = u.split("#", 1)[0].split("?", 1)[0]
+    if "//" in path or "/." in path or ";" in path or "\t" in u or "\r" in u or "\n" in u:
+        return None
+    return prefix + u
+
 def normalize_rows(rows: List[Dict], base_url: Optional[str] = None) -> List[Dict]:
     out: List[Dict] = []
+    now = datetime.now()  # one clock read per batch
+    # Listing pages repeat dates ("πριν 2 ώρες") and section labels a lot, so each
+    # distinct string is normalized once per batch and reused for the other rows.
+    dates: Dict[str, Optional[str]] = {}
+    texts: Dict[str, str] = {}
+    # base_url is the same for the whole batch, so parse it once
+    prefix = _root_prefix(base_url) if base_url else None
+
+    def tidy(v):
+        if type(v) is str:
+            tv = texts.get(v)
+            if tv is None:
+                tv = texts[v] = tidy_text(v)
+            return tv
+        return tidy_text(v)
+
     for r in rows:
-        rr = dict(r)
-        u = (rr.get("url") or "").strip()
+        url = r.get("url")
+        u = (url or "").strip()
         if base_url and u and not u.lower().startswith("http"):
-            rr["url"] = urljoin(base_url, u)
-        rr["date"] = normalize_date(rr.get("date"))
+            joined = _join_root(prefix, u) if prefix else None
+            url = joined if joined is not None else urljoin(base_url, u)
+        d = r.get("date")
+        if type(d) is str:
+            nd = dates.get(d, _SKIP)
+            if nd is _SKIP:
+                nd = dates[d] = normalize_date(d, now=now)
+        else:
+            nd = normalize_date(d, now=now)
         # Clean textual fields
-        for _k in ("title","summary","section"):
-            if rr.get(_k) is not None:
-                rr[_k] = tidy_text(rr[_k])
-        for k in REQUIRED_COLS:
-            rr.setdefault(k, None)
-        out.append(rr)
+        title, summary, section = r.get("title"), r.get("summary"), r.get("section")
+        # One dict per row instead of dict(r) + setdefault(): keys already in r keep
+        # their place, missing ones are appended in the order the old code added them.
+        out.append({
+            **r,
+            "date": nd,
+            "title": title if title is None else tidy(title),
+            "url": url,
+            "summary": summary if summary is None else tidy(summary),
+            "section": section if section is None else tidy(section),
+        })
     return out
 
@@ -1,9 +1,12 @@
 from __future__ import annotations
-from typing import Dict, List, Optional, Set, Tuple, Callable
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple, Callable
 from pathlib import Path
 from datetime import datetime
+from contextlib import ExitStack
+from functools import lru_cache
 from urllib.parse import quote_plus, urlparse, parse_qsl, urlencode, urlunparse
 import pandas as pd
+import csv
 import re
 import json
 import time
@@ -17,8 +20,10 @@ from .utils import greek_to_latin, slugify
 
 PLACEHOLDER_RE = re.compile(r"{([a-zA-Z_]\w*)}")
 
-def placeholders(tmpl: str) -> Set[str]:
-    return set(PLACEHOLDER_RE.findall(tmpl or ""))
+@lru_cache(maxsize=256)
+def placeholders(tmpl: str) -> FrozenSet[str]:
+    # page_url() asks this for every page of a run; templates rarely change
+    return frozenset(PLACEHOLDER_RE.findall(tmpl or ""))
 
 def format_with_ctx(tmpl: str, ctx: Dict[str, str]) -> str:
     try:
@@ -33,6 +38,7 @@ def _replace_query_param(url: str, param: str, value: int) -> str:
     new_q = urlencode(q, doseq=True)
     return urlunparse(u._replace(query=new_q))
 
+@lru_cache(maxsize=256)
 def _get_query_param_int(url: str, param: str) -> int | None:
     u = urlparse(url)
     for k, v in parse_qsl(u.query, keep_blank_values=True):
@@ -43,7 +49,15 @@ def _get_query_param_int(url: str, param: str) -> int | None:
                 return None
     return None
 
-def page_url(spec: ScraperSpec, page: int, vars: Dict[str, str] | None) -> str:
+def param_regex(spec: ScraperSpec) -> Optional[re.Pattern]:
+    """Matcher for an existing `?param=` / `&param=` in PARAM mode; compile once per run and pass to page_url()."""
+    pg = spec.pagination
+    if pg.mode == "param" and pg.param:
+        return re.compile(rf"(?:[?&]){re.escape(pg.param)}=")
+    return None
+
+def page_url(spec: ScraperSpec, page: int, vars: Dict[str, str] | None, *,
+             param_re: Optional[re.Pattern] = None) -> str:
     pg = spec.pagination
     base = str(spec.start_url)
 
@@ -70,6 +84,8 @@ def page_url(spec: ScraperSpec, page: int, vars: Dict[str, str] | None) -> str:
     if pg.mode == "param":
         # If the start_url already has the parameter, use that as the base offset for first_page.
         existing = _get_query_param_int(base_f, pg.param)
+        if param_re is None:
+            param_re = re.compile(rf"(?:[?&]){re.escape(pg.param)}=")
         if pg.per_page:
             # Compute the offset for this "page"
             # Base offset: existing value, or per_page * first_page (common default)
@@ -77,7 +93,7 @@ def page_url(spec: ScraperSpec, page: int, vars: Dict[str, str] | None) -> str:
             offset_val = base_offset + (page - pg.first_page) * pg.per_page
 
             # If start_url already has the param, replace it; otherwise, append it.
-            if re.search(rf"(?:[?&]){re.escape(pg.param)}=", base_f):
+            if param_re.search(base_f):
                 return _replace_query_param(base_f, pg.param, offset_val)
             else:
                 # If we're on first_page and site doesn't require start=0 explicitly, keep base_f as-is.
@@ -87,7 +103,7 @@ def page_url(spec: ScraperSpec, page: int, vars: Dict[str, str] | None) -> str:
                 return f"{base_f}{sep}{pg.param}={offset_val}"
         else:
             # Simple page-number param (no offset math)
-            if re.search(rf"(?:[?&]){re.escape(pg.param)}=", base_f):
+            if param_re.search(base_f):
                 return _replace_query_param(base_f, pg.param, page)
             if page == pg.first_page:
                 return base_f
@@ -207,6 +223,7 @@ def planned_urls(
 ) -> List[str]:
     urls: List[str] = []
     start_page = page_from if page_from is not None else spec.pagination.first_page
+    param_re = param_regex(spec)
 
     if fetch_all:
         # show a preview only
@@ -215,14 +232,14 @@ def planned_urls(
             p = start_page + i
             if page_to is not None and p > page_to:
                 break
-            urls.append(page_url(spec, p, vars))
+            urls.append(page_url(spec, p, vars, param_re=param_re))
         if page_to is None:
             urls.append("… (continues until empty page)")
         return urls
 
     if page_from is not None and page_to is not None:
         for p in range(page_from, page_to + 1):
-            urls.append(page_url(spec, p, vars))
+            urls.append(page_url(spec, p, vars, param_re=param_re))
         return urls
 
     # Fallback to "pages count" starting at start_page
@@ -230,7 +247,7 @@ def planned_urls(
         pages = 1
     for i in range(pages):
         p = start_page + i
-        urls.append(page_url(spec, p, vars))
+        urls.append(page_url(spec, p, vars, param_re=param_re))
     return urls
 
 def run_scraper(
@@ -242,20 +259,56 @@ def run_scraper(
     page_to: Optional[int] = None,
     hard_max_pages: int = 1000,
     progress: Optional[Callable[[dict], None]] = None,
+    urls: Optional[List[str]] = None,
 ) -> pd.DataFrame:
     """
     Supports three modes:
       - fetch_all=True: start at (page_from or first_page) and continue until an empty page (or page_to / hard_max_pages).
       - page_from & page_to: fetch inclusive range.
       - pages=N: fetch N pages starting at (page_from or first_page).
+    urls: optional precomputed page URLs (as returned by planned_urls with the same
+    arguments) so they are not rebuilt here. Ignored when fetch_all=True, since the
+    planned list is only a preview in that mode.
     """
     # fetcher_plain (Requests, js_required=False)
     fetcher_plain = HybridFetcher(js_required=False, page_load_strategy="eager")
     # fetcher_js (Selenium, js_required=True)
     fetcher_js = HybridFetcher(js_required=True, page_load_strategy="eager")
-    all_rows: List[Dict] = []
+    # Kept rows, deduplicated by URL as pages come in, plus every column seen
+    by_url: Dict[str, Dict] = {}
+    columns: Dict[str, None] = {}
+
+    # Keep only URLs that belong to the same site as spec.base_url
+    base_host = urlparse(str(spec.base_url)).netloc.lower().lstrip("www.")
+
+    def _belongs_to_site(u) -> bool:
+        if u is None:
+            return False
+        # Handle NaN and weird values
+        try:
+            s = str(u)
+        except Exception:
+            return False
+        if not s:
+            return False
+        try:
+            host = urlparse(s).netloc.lower().lstrip("www.")
+        except Exception:
+            return False
+        # Only accept exact host match ignoring leading 'www.'
+        return bool(host) and host == base_host
+
+    def _collect(rows: List[Dict]) -> None:
+        columns.update(dict.fromkeys(k for r in rows for k in r))
+        for r in rows:
+            u = r.get("url")
+            if _belongs_to_site(u):
+                # last one wins and moves to the end, like drop_duplicates(keep="last")
+                by_url.pop(u, None)
+                by_url[u] = r
 
     start_page = page_from if page_from is not None else spec.pagination.first_page
+    param_re = param_regex(spec)
 
     # === incremental saving setup ===
     # Data directory: repo_root/data/outputs/_partial/<spec-name>_<run-id>.csv
@@ -265,32 +318,152 @@ def run_scraper(
     partial_dir.mkdir(parents=True, exist_ok=True)
     partial_path = partial_dir / f"{slugify(spec.name)}_{run_id}.csv"
 
+    # The partial file is opened on the first non-empty page and kept open for the
+    # whole run; each page's rows go straight through one csv.DictWriter.
+    partial_files = ExitStack()
+    partial_writer: Optional[csv.DictWriter] = None
+    partial_file = None
+
     def _append_partial(rows: List[Dict]) -> None:
+        nonlocal partial_writer, partial_file
         if not rows:
             return
-        dfp = pd.DataFrame(rows)
-        # write header only on first write
-        header = not partial_path.exists()
-        dfp.to_csv(partial_path, mode="a", header=header, index=False, encoding="utf-8")
+        if partial_writer is None:
+            # write header only on first write
+            header = not partial_path.exists()
+            partial_file = partial_files.enter_context(partial_path.open("a", newline="", encoding="utf-8"))
+            fieldnames = list(dict.fromkeys(k for r in rows for k in r))
+            partial_writer = csv.DictWriter(partial_file, fieldnames=fieldnames, extrasaction="ignore")
+            if header:
+                partial_writer.writeheader()
+        partial_writer.writerows(rows)
+        partial_file.flush()  # the Run page may merge this file if the run times out
         if progress:
-            progress({"event": "partial_append", "rows": len(dfp), "file": str(partial_path)})
+            progress({"event": "partial_append", "rows": len(rows), "file": str(partial_path)})
 
     # === main fetch logic ===
+    # Drivers start lazily on first Selenium fetch and are reused across pages;
+    # the sessions make sure Chrome is shut down once this run is over.
+    with partial_files, fetcher_plain.session(), fetcher_js.session():
+        if fetch_all:
+            fetched = 0
+            max_empty_pages = 2
+            empty_streak = 0
+            prev_page_urls: Set[str] | None = None
+            while True:
+                current = start_page + fetched
+                if page_to is not None and current > page_to:
+                    break
+                target_url = page_url(spec, current, vars, param_re=param_re)
+                if progress:
+                    progress({"event": "fetch_start", "page": current, "url": target_url, "site": spec.name})
+                try:
+                    # 1) If JS required in spec -> use Selenium
+                    if spec.js_required:
+                        final_url, html = fetcher_js.get(
+                            target_url,
+                            headers=spec.headers,
+                            wait_for_css=(spec.item_css or spec.main_container_css or None),
+                            wait_timeout=20,
+                        )
+                        if spec.response_type == "json":
+                            rows = _extract_from_json(spec, html)
+                            rows = normalize_rows(rows, base_url=final_url)
+                        else:
+                            rows = extract_items(
+                                html,
+                                spec.selectors,
+                                container_css=spec.main_container_css,
+                                item_css=spec.item_css,
+                            )
+                            rows = normalize_rows(rows, base_url=final_url)
+                    else:
+                        # 2) Try Requests first
+                        final_url, html = fetcher_plain.get(
+                            target_url,
+                            headers=spec.headers,
+                            wait_for_css=(spec.item_css or spec.main_container_css or None),
+                            wait_timeout=20,
+                        )
+                        if spec.response_type == "json":
+                            rows = _extract_from_json(spec, html)
+                            rows = normalize_rows(rows, base_url=final_url)
+                        else:
+                            rows = extract_items(
+                                html,
+                                spec.selectors,
+                                container_css=spec.main_container_css,
+                                item_css=spec.item_css,
+                            )
+                            rows = normalize_rows(rows, base_url=final_url)
+
+                            # 3) If nothing found and it's HTML -> try fallback to Selenium
+                            if not rows:
+                                final_url, html = fetcher_js.get(
+                                    target_url,
+                                    headers=spec.headers,
+                                    wait_for_css=(spec.item_css or spec.main_container_css or None),
+                                    wait_timeout=20,
+                                )
+                                rows = extract_items(
+                                    html,
+                                    spec.selectors,
+                                    container_css=spec.main_container_css,
+                                    item_css=spec.item_css,
+                                )
+                                rows = normalize_rows(rows, base_url=final_url)
+
+                except Exception as e:
+                    # In fetch_all mode, if we've already fetched some pages
+                    # and get a timeout/404, treat it as "end of pages"
+                    is_timeout = e.__class__.__name__.lower().endswith("timeout")
+                    is_http404 = getattr(getattr(e, "response", None), "status_code", None) == 404
+                    if fetched > 0 and (is_timeout or is_http404):
+                        if progress:
+                            progress({"event": "assume_end", "page": current, "url": target_url, "reason": str(e)})
+                        break
+                    raise
+
+                if not rows:
+                    empty_streak += 1
+                    if empty_streak >= max_empty_pages:
+                        break
+                    else:
+                        fetched += 1
+                        continue
+                else:
+                    empty_streak = 0
+
+                # detect duplicate pages (same URLs as previous page)
+                # Collect URLs for this page (non-empty strings)
+                page_urls = {r.get("url") for r in rows if r.get("url")}
+                if prev_page_urls is not None and page_urls and page_urls == prev_page_urls:
+                    # Same URL set as previous page
+                    # Some sites like skai recycle the last page indefinitely. Treat this as "end of pages".
+                    if progress:
+                        progress({
+                            "event": "assume_end_duplicate",
+                            "page": current,
+                            "url": target_url,
+                            "reason": "duplicate_page_urls",
+                        })
+                    break
+                prev_page_urls = page_urls
+
+                _collect(rows)
+                _append_partial(rows)
+                time.sleep(random.uniform(0.5, 1.8))
+                fetched += 1
+                if fetched >= hard_max_pages:
+                    break
+
+        elif page_from is not None and page_to is not None:
+            # Explicit page range
+            for i, p in enumerate(range(page_from, page_to + 1)):
+                target_url = urls[i] if urls is not None and i < len(urls) else page_url(spec, p, vars, param_re=param_re)
+                if progress:
+                    progress({"event": "fetch_start", "page": p, "url": target_url, "site": spec.name})
 
-    if fetch_all:
-        fetched = 0
-        max_empty_pages = 2
-        empty_streak = 0
-        prev_page_urls: Set[str] | None = None
-        while True:
-            current = start_page + fetched
-            if page_to is not None and current > page_to:
-                break
-            target_url = page_url(spec, current, vars)
-            if progress:
-                progress({"event": "fetch_start", "page": current, "url": target_url, "site": spec.name})
-            try:
-                # 1) If JS required in spec -> use Selenium
                 if spec.js_required:
                     final_url, html = fetcher_js.get(
                         target_url,
@@ -310,7 +483,7 @@ def run_scraper(
                         )
                         rows = normalize_rows(rows, base_url=final_url)
                 else:
-                    # 2) Try Requests first
+                    # Requests first
                     final_url, html = fetcher_plain.get(
                         target_url,
                         headers=spec.headers,
@@ -329,7 +502,7 @@ def run_scraper(
                         )
                         rows = normalize_rows(rows, base_url=final_url)
 
-                        # 3) If nothing found and it's HTML -> try fallback to Selenium
+                        # fallback to Selenium if HTML + 0 rows
                         if not rows:
                             final_url, html = fetcher_js.get(
                                 target_url,
@@ -345,103 +518,31 @@ def run_scraper(
                             )
                             rows = normalize_rows(rows, base_url=final_url)
 
-            except Exception as e:
-                # In fetch_all mode, if we've already fetched some pages
-                # and get a timeout/404, treat it as "end of pages"
-                is_timeout = e.__class__.__name__.lower().endswith("timeout")
-                is_http404 = getattr(getattr(e, "response", None), "status_code", None) == 404
-                if fetched > 0 and (is_timeout or is_http404):
-                    if progress:
-                        progress({"event": "assume_end", "page": current, "url": target_url, "reason": str(e)})
-                    break
-                raise
+                _collect(rows)
+                _append_partial(rows)
+                time.sleep(random.uniform(0.5, 1.8))
 
-            if not rows:
-                empty_streak += 1
-                if empty_streak >= max_empty_pages:
-                    break
-                else:
-                    fetched += 1
-                    continue
-            else:
-                empty_streak = 0
-
-            # detect duplicate pages (same URLs as previous page)
-            # Collect URLs for this page (non-empty strings)
-            page_urls = {r.get("url") for r in rows if r.get("url")}
-            if prev_page_urls is not None and page_urls and page_urls == prev_page_urls:
-                # Same URL set as previous page
-                # Some sites like skai recycle the last page indefinitely. Treat this as "end of pages".
+        else:
+            # pages = N starting from start_page
+            if not pages:
+                pages = 1
+            for i in range(pages):
+                p = start_page + i
+                target_url = urls[i] if urls is not None and i < len(urls) else page_url(spec, p, vars, param_re=param_re)
                 if progress:
-                    progress({
-                        "event": "assume_end_duplicate",
-                        "page": current,
-                        "url": target_url,
-                        "reason": "duplicate_page_urls",
-                    })
-                break
-            prev_page_urls = page_urls
-
-            all_rows.extend(rows)
-            _append_partial(rows)
-            time.sleep(random.uniform(0.5, 1.8))
-            fetched += 1
-            if fetched >= hard_max_pages:
-                break
+                    progress({"event": "fetch_start", "page": p, "url": target_url, "site": spec.name})
 
-    elif page_from is not None and page_to is not None:
-        # Explicit page range
-        for p in range(page_from, page_to + 1):
-            target_url = page_url(spec, p, vars)
-            if progress:
-                progress({"event": "fetch_start", "page": p, "url": target_url, "site": spec.name})
-
-            if spec.js_required:
-                final_url, html = fetcher_js.get(
-                    target_url,
-                    headers=spec.headers,
-                    wait_for_css=(spec.item_css or spec.main_container_css or None),
-                    wait_timeout=20,
-                )
-                if spec.response_type == "json":
-                    rows = _extract_from_json(spec, html)
-                    rows = normalize_rows(rows, base_url=final_url)
-                else:
-                    rows = extract_items(
-                        html,
-                        spec.selectors,
-                        container_css=spec.main_container_css,
-                        item_css=spec.item_css,
-                    )
-                    rows = normalize_rows(rows, base_url=final_url)
-            else:
-                # Requests first
-                final_url, html = fetcher_plain.get(
-                    target_url,
-                    headers=spec.headers,
-                    wait_for_css=(spec.item_css or spec.main_container_css or None),
-                    wait_timeout=20,
-                )
-                if spec.response_type == "json":
-                    rows = _extract_from_json(spec, html)
-                    rows = normalize_rows(rows, base_url=final_url)
-                else:
-                    rows = extract_items(
-                        html,
-                        spec.selectors,
-                        container_css=spec.main_container_css,
-                        item_css=spec.item_css,
+                if spec.js_required:
+                    final_url, html = fetcher_js.get(
+                        target_url,
+                        headers=spec.headers,
+                        wait_for_css=(spec.item_css or spec.main_container_css or None),
+                        wait_timeout=20,
                     )
-                    rows = normalize_rows(rows, base_url=final_url)
-
-                    # fallback to Selenium if HTML + 0 rows
-                    if not rows:
-                        final_url, html = fetcher_js.get(
-                            target_url,
-                            headers=spec.headers,
-                            wait_for_css=(spec.item_css or spec.main_container_css or None),
-                            wait_timeout=20,
-                        )
+                    if spec.response_type == "json":
+                        rows = _extract_from_json(spec, html)
+                        rows = normalize_rows(rows, base_url=final_url)
+                    else:
                         rows = extract_items(
                             html,
                             spec.selectors,
@@ -449,67 +550,18 @@ def run_scraper(
                             item_css=spec.item_css,
                         )
                         rows = normalize_rows(rows, base_url=final_url)
-
-            all_rows.extend(rows)
-            _append_partial(rows)
-            time.sleep(random.uniform(0.5, 1.8))
-
-    else:
-        # pages = N starting from start_page
-        if not pages:
-            pages = 1
-        for i in range(pages):
-            p = start_page + i
-            target_url = page_url(spec, p, vars)
-            if progress:
-                progress({"event": "fetch_start", "page": p, "url": target_url, "site": spec.name})
-
-            if spec.js_required:
-                final_url, html = fetcher_js.get(
-                    target_url,
-                    headers=spec.headers,
-                    wait_for_css=(spec.item_css or spec.main_container_css or None),
-                    wait_timeout=20,
-                )
-                if spec.response_type == "json":
-                    rows = _extract_from_json(spec, html)
-                    rows = normalize_rows(rows, base_url=final_url)
-                else:
-                    rows = extract_items(
-                        html,
-                        spec.selectors,
-                        container_css=spec.main_container_css,
-                        item_css=spec.item_css,
-                    )
-                    rows = normalize_rows(rows, base_url=final_url)
-            else:
-                # Requests first
-                final_url, html = fetcher_plain.get(
-                    target_url,
-                    headers=spec.headers,
-                    wait_for_css=(spec.item_css or spec.main_container_css or None),
-                    wait_timeout=20,
-                )
-                if spec.response_type == "json":
-                    rows = _extract_from_json(spec, html)
-                    rows = normalize_rows(rows, base_url=final_url)
                 else:
-                    rows = extract_items(
-                        html,
-                        spec.selectors,
-                        container_css=spec.main_container_css,
-                        item_css=spec.item_css,
+                    # Requests first
+                    final_url, html = fetcher_plain.get(
+                        target_url,
+                        headers=spec.headers,
+                        wait_for_css=(spec.item_css or spec.main_container_css or None),
+                        wait_timeout=20,
                     )
-                    rows = normalize_rows(rows, base_url=final_url)
-
-                    # fallback to Selenium if HTML + 0 rows
-                    if not rows:
-                        final_url, html = fetcher_js.get(
-                            target_url,
-                            headers=spec.headers,
-                            wait_for_css=(spec.item_css or spec.main_container_css or None),
-                            wait_timeout=20,
-                        )
+                    if spec.response_type == "json":
+                        rows = _extract_from_json(spec, html)
+                        rows = normalize_rows(rows, base_url=final_url)
+                    else:
                         rows = extract_items(
                             html,
                             spec.selectors,
@@ -518,39 +570,27 @@ def run_scraper(
                         )
                         rows = normalize_rows(rows, base_url=final_url)
 
-            all_rows.extend(rows)
-            _append_partial(rows)
-            time.sleep(random.uniform(0.5, 1.8))
-
-    # Build final DataFrame
-    df = pd.DataFrame(all_rows)
-
-    if "url" in df.columns:
-        # Keep only URLs that belong to the same site as spec.base_url
-        base_host = urlparse(str(spec.base_url)).netloc.lower().lstrip("www.")
-
-        def _belongs_to_site(u) -> bool:
-            if u is None:
-                return False
-            # Handle NaN and weird values
-            try:
-                s = str(u)
-            except Exception:
-                return False
-            if not s:
-                return False
-            try:
-                host = urlparse(s).netloc.lower().lstrip("www.")
-            except Exception:
-                return False
-            # Only accept exact host match ignoring leading 'www.'
-            return bool(host) and host == base_host
-
-        df = df[df["url"].apply(_belongs_to_site)]
+                        # fallback to Selenium if HTML + 0 rows
+                        if not rows:
+                            final_url, html = fetcher_js.get(
+                                target_url,
+                                headers=spec.headers,
+                                wait_for_css=(spec.item_css or spec.main_container_css or None),
+                                wait_timeout=20,
+                            )
+                            rows = extract_items(
+                                html,
+                                spec.selectors,
+                                container_css=spec.main_container_css,
+                                item_css=spec.item_css,
+                            )
+                            rows = normalize_rows(rows, base_url=final_url)
 
-        # Deduplicate by URL
-        df = df.drop_duplicates(subset=["url"], keep="last")
+                _collect(rows)
+                _append_partial(rows)
+                time.sleep(random.uniform(0.5, 1.8))
 
-    return df
+    # Build final DataFrame
+    return pd.DataFrame(list(by_url.values()), columns=list(columns))
 
 
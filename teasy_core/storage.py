@@ -1,19 +1,433 @@
 from __future__ import annotations
+import csv
+import io
+import math
+import os
+from contextlib import contextmanager
+import numpy as np
 import pandas as pd
 from pathlib import Path
+from typing import Callable, List, Optional, Sequence
 
-def save_or_merge_csv(df: pd.DataFrame, path: Path, dedup_on: str = "url") -> tuple[int,int,int]:
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from pyarrow import csv as pacsv
+    import pyarrow.parquet as pq
+except ImportError:  # optional; see TEASY_CSV_ENGINE and the .parquet backend
+    pacsv = pq = None
+
+try:
+    import polars as pl
+except ImportError:  # optional; see TEASY_CSV_ENGINE
+    pl = None
+
+try:
+    import zstandard
+except ImportError:  # optional; only needed for .zst outputs
+    zstandard = None
+
+# Opt-in: TEASY_CSV_ENGINE=pyarrow|polars reads/writes the merged output CSV with
+# that library's multi-threaded CSV reader/writer, converting to pandas only for
+# the merge itself (Polars also does full-rewrite merges natively). Defaults to
+# pandas; an engine that isn't installed falls back to it too.
+CSV_ENGINE = os.getenv("TEASY_CSV_ENGINE", "pandas").lower()
+
+# Opt-in: TEASY_KEY_BLOOM=1 keeps a Bloom filter of each output CSV's dedup keys in
+# a "<name>.bloom" sidecar. Appends whose keys are all new then skip reading the
+# file's key column; keys the filter may have seen are still checked against it.
+KEY_BLOOM = os.getenv("TEASY_KEY_BLOOM", "0") == "1"
+
+# Output paths ending in .zst (e.g. site_search_x.csv.zst) are zstd-compressed CSV.
+# Appends add a new zstd frame, which all three readers decode as one stream.
+ZSTD_LEVEL = 3
+
+def _is_zst(path: Path) -> bool:
+    return path.suffix.lower() == ".zst"
+
+@contextmanager
+def _out_stream(f, path: Path):
+    """Yield `f`, or a zstd writer over it when `path` is a .zst file."""
+    if not _is_zst(path):
+        yield f
+        return
+    if zstandard is None:
+        raise ImportError("zstandard is required for .zst outputs")
+    with zstandard.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(f, closefd=False) as z:
+        yield z
+
+@contextmanager
+def _open_text(path: Path, mode: str = "r"):
+    """Open `path` as UTF-8 CSV text for reading ("r") or appending ("a"), through zstd for .zst files."""
+    if not _is_zst(path):
+        with path.open(mode, newline="", encoding="utf-8") as f:
+            yield f
+        return
+    if zstandard is None:
+        raise ImportError("zstandard is required for .zst outputs")
+    with path.open(mode + "b") as raw:
+        if mode == "r":
+            stream = zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True, closefd=False)
+            with io.TextIOWrapper(stream, encoding="utf-8", newline="") as f:
+                yield f
+        else:
+            with _out_stream(raw, path) as z, io.TextIOWrapper(z, encoding="utf-8", newline="") as f:
+                yield f
+
+def _text_columns(df: pd.DataFrame) -> List[str]:
+    # Columns the caller holds as text; reading them back as text skips type inference
+    return [c for c, t in df.dtypes.items() if pd.api.types.is_string_dtype(t)]
+
+def _read_csv(path: Path, columns: Optional[List[str]] = None,
+              text: Sequence[str] = ()) -> pd.DataFrame:
+    """
+    Read `path` (only `columns`, if given). `text` columns are read as strings with
+    every engine, so they round-trip unchanged instead of being re-typed by the
+    parser (e.g. Arrow turning ISO dates into timestamps, Polars "0123" into 123).
+    """
+    if CSV_ENGINE == "pyarrow" and pacsv is not None:
+        # Arrow's timestamp/date/time inference can't be switched off, so every column
+        # is read as text, not just `text`: otherwise a date column the new frame
+        # doesn't have would still come back as timestamps and be rewritten.
+        names = columns if columns is not None else list(pd.read_csv(path, nrows=0).columns)
+        try:
+            # empty fields become nulls, as with pandas' NaN
+            opts = pacsv.ConvertOptions(include_columns=columns or [], strings_can_be_null=True,
+                                        column_types={c: pa.string() for c in [*names, *text]})
+            return pacsv.read_csv(path, convert_options=opts).to_pandas(types_mapper=pd.ArrowDtype)
+        except pa.ArrowInvalid:
+            pass  # e.g. empty or ragged file; let pandas have a go
+    elif CSV_ENGINE == "polars" and pl is not None:
+        return pl.read_csv(path, columns=columns, infer_schema_length=None,
+                           schema_overrides={c: pl.String for c in text}).to_pandas()
+    # low_memory=False parses each column in one go rather than inferring per block
+    return pd.read_csv(path, usecols=columns, dtype=dict.fromkeys(text, str) or None, low_memory=False)
+
+def _dump_csv(df: pd.DataFrame, f, header: bool) -> None:
+    if CSV_ENGINE == "pyarrow" and pacsv is not None:
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            table = None  # columns mixing types Arrow can't hold in one array
+        if table is not None:
+            pacsv.write_csv(table, f, write_options=pacsv.WriteOptions(include_header=header))
+            return
+    elif CSV_ENGINE == "polars" and pl is not None:
+        pl.from_pandas(df).write_csv(f, include_header=header)
+        return
+    # mode tells pandas `f` is binary even when it's a compressing stream
+    df.to_csv(f, header=header, index=False, mode="wb")
+
+def _write_csv(df: pd.DataFrame, path: Path, append: bool = False) -> None:
+    """Write `df` to `path`; with append=True, add its rows (no header) to the end of the file."""
+    if append:
+        with path.open("ab") as f, _out_stream(f, path) as out:
+            _dump_csv(df, out, header=False)
+        return
+    _replace_file(path, lambda f: _dump_csv(df, f, header=True))
+
+def _replace_file(path: Path, dump: Callable) -> None:
+    # Full rewrites go to a sibling temp file that replaces `path` only once it is
+    # complete and on disk, so a crash mid-write leaves the previous file intact
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("wb", buffering=1 << 20) as f:
+        with _out_stream(f, path) as out:
+            dump(out)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+def _first_per_key(df: pd.DataFrame, key: str) -> pd.DataFrame:
+    # Same rows as drop_duplicates(subset=[key], keep="first"), but one hash-table
+    # pass over the single key column instead of the general multi-column path
+    return df[~df[key].duplicated(keep="first")]
+
+# Rows of the existing file's key column held in memory at once by the pandas engine
+KEY_CHUNK_ROWS = 100_000
+
+def _key_chunks(path: Path, dedup_on: str, dtype=None):
+    with pd.read_csv(path, usecols=[dedup_on], dtype=dtype, chunksize=KEY_CHUNK_ROWS) as reader:
+        for chunk in reader:
+            yield chunk[dedup_on]
+
+def _is_in(keys: pd.Series, values: "pa.ChunkedArray") -> pd.Series:
+    # Arrow's hash kernel runs on the UTF-8 buffers, with no Python object per
+    # existing key; nulls match nulls, as the isna() check below does for isin()
+    arr = pa.array(keys.astype("string"), type=pa.string(), from_pandas=True)
+    hit = pc.is_in(arr, value_set=values.combine_chunks())
+    return pd.Series(hit.to_numpy(zero_copy_only=False), index=keys.index)
+
+def _existing_keys(path: Path, keys: pd.Series, dedup_on: str) -> tuple[int, pd.Series]:
+    """
+    Return (rows in `path`, mask of `keys` already present in its `dedup_on` column).
+    The pandas engine streams the column in KEY_CHUNK_ROWS chunks, so memory stays
+    flat however long the history gets; the Arrow/Polars engines read it whole.
+    """
+    if CSV_ENGINE == "pyarrow" and pacsv is not None:
+        opts = pacsv.ConvertOptions(include_columns=[dedup_on], column_types={dedup_on: pa.string()},
+                                    strings_can_be_null=True)
+        try:
+            existing = pacsv.read_csv(path, convert_options=opts).column(dedup_on)
+            return len(existing), _is_in(keys, existing)
+        except pa.ArrowInvalid:
+            pass  # e.g. ragged rows; let pandas have a go
+    if CSV_ENGINE == "polars" and pl is not None:
+        chunks = iter([_read_csv(path, columns=[dedup_on])[dedup_on]])
+    else:
+        # text keys (e.g. URLs) are compared as text, so there's nothing to infer
+        text = pd.api.types.is_string_dtype(keys.dtype)
+        chunks = _key_chunks(path, dedup_on, {dedup_on: str} if text else None)
+    before = 0
+    seen = pd.Series(False, index=keys.index)
+    for chunk in chunks:
+        before += len(chunk)
+        seen |= keys.isin(chunk)
+        if chunk.isna().any():
+            # engines return empty keys as NaN/None/NA, which isin() doesn't always equate
+            seen |= keys.isna()
+    return before, seen
+
+class _KeyBloom:
+    """
+    Bloom filter over the hashes of a CSV's key column, saved next to it as an
+    .npz sidecar. It records the CSV's size and mtime and is ignored (then rebuilt)
+    once those change, e.g. after a full rewrite or an edit by hand.
+    """
+    ERROR_RATE = 0.001
+    MIN_CAPACITY = 100_000
+
+    def __init__(self, capacity: int, dedup_on: str):
+        self.capacity = capacity
+        self.dedup_on = dedup_on
+        self.m = math.ceil(-capacity * math.log(self.ERROR_RATE) / math.log(2) ** 2)
+        self.k = max(1, round(self.m / capacity * math.log(2)))
+        self.bits = np.zeros(self.m, dtype=bool)
+        self.rows = 0
+
+    @staticmethod
+    def sidecar(path: Path) -> Path:
+        return path.with_name(path.name + ".bloom")
+
+    @staticmethod
+    def _hashes(keys: pd.Series) -> np.ndarray:
+        return pd.util.hash_pandas_object(keys.astype("string"), index=False).to_numpy(dtype=np.uint64)
+
+    def _positions(self, h: np.ndarray) -> np.ndarray:
+        # k probes per key by double hashing the two halves of pandas' 64-bit hash
+        h1, h2 = h & np.uint64(0xFFFFFFFF), (h >> np.uint64(32)) | np.uint64(1)
+        probes = h1[:, None] + np.arange(self.k, dtype=np.uint64)[None, :] * h2[:, None]
+        return probes % np.uint64(self.m)
+
+    def _add_hashes(self, h: np.ndarray) -> None:
+        self.bits[self._positions(h)] = True
+        self.rows += len(h)
+
+    def add(self, keys: pd.Series) -> None:
+        self._add_hashes(self._hashes(keys))
+
+    def might_contain(self, keys: pd.Series) -> np.ndarray:
+        return self.bits[self._positions(self._hashes(keys))].all(axis=1)
+
+    @classmethod
+    def build(cls, path: Path, dedup_on: str) -> "_KeyBloom":
+        # One pass over the key column: only the 8-byte hashes are kept, so the
+        # filter can be sized from their count before any bit is set
+        hashes = [cls._hashes(chunk) for chunk in _key_chunks(path, dedup_on, {dedup_on: str})]
+        h = np.concatenate(hashes) if hashes else np.empty(0, dtype=np.uint64)
+        bloom = cls(max(2 * len(h), cls.MIN_CAPACITY), dedup_on)
+        bloom._add_hashes(h)
+        return bloom
+
+    @classmethod
+    def load(cls, path: Path, dedup_on: str) -> Optional["_KeyBloom"]:
+        """The sidecar of `path`, or None when it's missing, stale, full or for another key."""
+        try:
+            with np.load(cls.sidecar(path)) as z:
+                capacity, rows, size, mtime_ns = (int(v) for v in z["meta"])
+                if str(z["key"]) != dedup_on or rows > capacity:
+                    return None
+                st = path.stat()
+                if (size, mtime_ns) != (st.st_size, st.st_mtime_ns):
+                    return None
+                bloom = cls(capacity, dedup_on)
+                bloom.bits = np.unpackbits(z["bits"], count=bloom.m).astype(bool)
+                bloom.rows = rows
+                return bloom
+        except (OSError, KeyError, ValueError):
+            return None
+
+    def save(self, path: Path) -> None:
+        st = path.stat()
+        meta = np.array([self.capacity, self.rows, st.st_size, st.st_mtime_ns], dtype=np.int64)
+        _replace_file(self.sidecar(path), lambda f: np.savez(
+            f, bits=np.packbits(self.bits), meta=meta, key=np.array(self.dedup_on)))
+
+def _string_table(df: pd.DataFrame) -> "pa.Table":
+    # Everything is stored as strings (nulls kept), so files written by different
+    # runs always share a schema, as with the run-log Parquet parts.
+    sdf = df.astype("string")
+    schema = pa.schema([(str(c), pa.string()) for c in sdf.columns])
+    return pa.Table.from_pandas(sdf, preserve_index=False).rename_columns(schema.names).cast(schema)
+
+def _conform(table: "pa.Table", schema: "pa.Schema") -> "pa.Table":
+    # reorder to `schema`, adding all-null columns the table doesn't have
+    cols = [table.column(f.name) if f.name in table.column_names else pa.nulls(len(table), f.type)
+            for f in schema]
+    return pa.Table.from_arrays(cols, schema=schema)
+
+def _save_or_merge_parquet(df: pd.DataFrame, path: Path, dedup_on: str,
+                           skip_new_dedup: bool = False) -> tuple[int,int,int]:
+    """
+    Parquet counterpart of save_or_merge_csv: only the `dedup_on` column of the
+    existing file is read to find new rows. A Parquet footer can't be extended in
+    place, so existing row groups are copied one at a time into a new file followed
+    by a row group of new rows, and the new file replaces the old one.
+    """
+    if pq is None:
+        raise ImportError("pyarrow is required for .parquet outputs")
+    new = _string_table(df)
+    if dedup_on in new.column_names:
+        keys = new.column(dedup_on).to_pandas()
+        mask = pd.Series(True, index=keys.index) if skip_new_dedup else ~keys.duplicated(keep="first")
+        if path.exists():
+            with pq.ParquetFile(path) as pf:
+                if dedup_on in pf.schema_arrow.names:
+                    mask &= ~_is_in(keys, pf.read(columns=[dedup_on]).column(dedup_on))
+        new = new.filter(pa.array(mask.to_numpy(dtype=bool)))
+
+    if not path.exists():
+        pq.write_table(new, path, compression="zstd")
+        return 0, len(new), len(new)
+
+    with pq.ParquetFile(path) as pf:
+        before = pf.metadata.num_rows
+        if not len(new):
+            return before, 0, before
+        schema = pa.unify_schemas([pf.schema_arrow, new.schema])
+        tmp = path.with_name(path.name + ".tmp")
+        with pq.ParquetWriter(tmp, schema, compression="zstd") as writer:
+            for i in range(pf.num_row_groups):
+                writer.write_table(_conform(pf.read_row_group(i), schema))
+            writer.write_table(_conform(new, schema))
+    os.replace(tmp, path)
+    return before, len(new), before + len(new)
+
+def _rewrite_polars(df: pd.DataFrame, path: Path, dedup_on: str) -> tuple[int,int,int]:
+    # Rewrite path kept in Polars end to end: the concat and the keep-first unique
+    # run multi-threaded on Arrow buffers, with no pandas round-trip of the history
+    merged = pl.from_pandas(df)
+    before = 0
+    if path.exists():
+        prev = pl.read_csv(path, infer_schema_length=None,
+                           schema_overrides={c: pl.String for c in _text_columns(df)})
+        before = prev.height
+        # like pd.concat: union of columns (file's first), types widened to fit both
+        merged = pl.concat([prev, merged], how="diagonal_relaxed")
+    if dedup_on in merged.columns:
+        merged = merged.unique(subset=[dedup_on], keep="first", maintain_order=True)
+    _replace_file(path, merged.write_csv)
+    after = merged.height
+    return before, max(0, after - before), after
+
+def save_or_merge_csv(df: pd.DataFrame, path: Path, dedup_on: str = "url",
+                      skip_new_dedup: bool = False) -> tuple[int,int,int]:
+    """
+    Merge `df` into `path`, keeping the first row per `dedup_on`; `.parquet` paths use
+    the Parquet backend and `.zst` paths are zstd-compressed CSV. Pass skip_new_dedup=True when `df` is already unique on
+    `dedup_on` (e.g. run_scraper output): its keys are then only checked against
+    the file's, not against each other.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix.lower() == ".parquet":
+        return _save_or_merge_parquet(df, path, dedup_on, skip_new_dedup)
+    if path.exists() and dedup_on in df.columns:
+        header = list(pd.read_csv(path, nrows=0).columns)
+        if dedup_on in header:
+            # Only the key column of the existing file is read to find the new rows
+            new_rows = df if skip_new_dedup else _first_per_key(df, dedup_on)
+            keys = new_rows[dedup_on]
+            bloom = None
+            if KEY_BLOOM:
+                bloom = _KeyBloom.load(path, dedup_on)
+                if bloom is None:
+                    bloom = _KeyBloom.build(path, dedup_on)
+                    bloom.save(path)
+            if bloom is None:
+                before, seen = _existing_keys(path, keys, dedup_on)
+            else:
+                maybe = bloom.might_contain(keys)
+                before, hits = bloom.rows, np.zeros(len(keys), dtype=bool)
+                if maybe.any():
+                    # only keys the filter may have seen need the file's key column
+                    before, seen = _existing_keys(path, keys[maybe], dedup_on)
+                    hits[maybe] = seen.to_numpy()
+                seen = pd.Series(hits, index=keys.index)
+            new_rows = new_rows[~seen]
+            if not len(new_rows):
+                # nothing to add: leave the file untouched, even if df has extra columns
+                return before, 0, before
+            if set(df.columns) <= set(header):
+                # append the delta under the existing header instead of rewriting the file
+                _write_csv(new_rows.reindex(columns=header), path, append=True)
+                if bloom is not None:
+                    bloom.add(new_rows[dedup_on])
+                    bloom.save(path)
+                return before, len(new_rows), before + len(new_rows)
+
+    # New file, or the new rows bring columns the file doesn't have: (re)write it all
+    if CSV_ENGINE == "polars" and pl is not None:
+        return _rewrite_polars(df, path, dedup_on)
     before = 0
     if path.exists():
-        prev = pd.read_csv(path)
+        prev = _read_csv(path, text=_text_columns(df))
         before = len(prev)
         merged = pd.concat([prev, df], ignore_index=True)
     else:
         merged = df.copy()
     if dedup_on in merged.columns:
-        merged = merged.drop_duplicates(subset=[dedup_on], keep="first").reset_index(drop=True)
-    merged.to_csv(path, index=False)
+        merged = _first_per_key(merged, dedup_on).reset_index(drop=True)
+    _write_csv(merged, path)
     after = len(merged)
     added = max(0, after - before)
     return before, added, after
+
+def save_or_merge_csv_path(partial_path: Path, path: Path, dedup_on: str = "url") -> tuple[int,int,int]:
+    """
+    Stream-merge the rows of a CSV file (e.g. a runner partial) into `path`,
+    keeping the first occurrence per `dedup_on`. Rows are appended one at a time,
+    so neither file is loaded into memory as a DataFrame.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    before = 0
+    header = None
+    seen: set[str] = set()
+    if path.exists():
+        with _open_text(path) as f:
+            reader = csv.DictReader(f)
+            header = reader.fieldnames
+            for row in reader:
+                before += 1
+                seen.add(row.get(dedup_on))
+
+    added = 0
+    with partial_path.open(newline="", encoding="utf-8") as src:
+        reader = csv.DictReader(src)
+        if not reader.fieldnames:
+            return before, 0, before
+        write_header = header is None
+        if write_header:
+            header = reader.fieldnames
+        dedup = dedup_on in header
+        with _open_text(path, "a") as dst:
+            writer = csv.DictWriter(dst, fieldnames=header, extrasaction="ignore")
+            if write_header:
+                writer.writeheader()
+            for row in reader:
+                if dedup:
+                    key = row.get(dedup_on)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                writer.writerow(row)
+                added += 1
+    return before, added, before + added
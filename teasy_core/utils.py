@@ -1,15 +1,20 @@
 from __future__ import annotations
 import random
 import re
+from functools import lru_cache
 from unicodedata import normalize
 
+import pandas as pd
+
+# Fixed pool, built once at import instead of on every call
+_USER_AGENTS = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 14_5) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.5 Safari/605.1.15",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125 Safari/537.36",
+)
+
 def user_agent() -> str:
-    agents = [
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126 Safari/537.36",
-        "Mozilla/5.0 (Macintosh; Intel Mac OS X 14_5) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.5 Safari/605.1.15",
-        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125 Safari/537.36",
-    ]
-    return random.choice(agents)
+    return random.choice(_USER_AGENTS)
 
 _G2L = str.maketrans({
     "ά":"a","α":"a","Ά":"a","Α":"a",
@@ -38,16 +43,42 @@ _G2L = str.maketrans({
     "ω":"o","ώ":"o","Ω":"o","Ώ":"o",
 })
 
+# Both are pure and get called with the same few search terms/spec names over and over
+@lru_cache(maxsize=4096)
 def greek_to_latin(text: str) -> str:
-    return (text or "").translate(_G2L)
+    text = text or ""
+    # nothing in _G2L is ASCII, so skip the per-character table walk
+    return text if text.isascii() else text.translate(_G2L)
 
+# Combining diacritical marks (U+0300–U+036F) left behind by NFKD, deleted in one translate pass
+_COMBINING = dict.fromkeys(range(0x300, 0x370))
+# Explicit cases are cheaper to match than re.IGNORECASE; under that flag the
+# dotless "ı" (the one non-ASCII letter NFKD leaves that folds to [a-z]) was kept,
+# so it stays in the class. Existing dashes are part of each run, so one pass
+# already collapses them.
+_SLUG_RE = re.compile("[^A-Za-z0-9\u0131]+")
+
+@lru_cache(maxsize=4096)
 def slugify(value: str) -> str:
     raw = (value or "").strip()
     if not raw:
         return "search"
-    raw = greek_to_latin(raw)
-    raw = normalize("NFKD", raw)
-    raw = "".join(ch for ch in raw if not ord(ch) in range(0x300, 0x370))
-    slug = re.sub(r"[^a-z0-9]+", "-", raw, flags=re.IGNORECASE)
-    slug = re.sub(r"-+", "-", slug).strip("-")
+    if not raw.isascii():
+        # NFKD splits accents off (and maps fullwidth digits, ligatures, ...); for
+        # ASCII input all three steps are no-ops
+        raw = normalize("NFKD", greek_to_latin(raw)).translate(_COMBINING)
+    slug = _SLUG_RE.sub("-", raw).strip("-")
     return slug or "search"
+
+def slugify_series(values: pd.Series) -> pd.Series:
+    """
+    Column-wise slugify(): the same slug per value (missing ones become "search"),
+    computed with the .str accessor instead of a Python call per row. Prefer it
+    over .map(slugify) for bulk columns.
+    """
+    s = values.astype("string").fillna("")
+    # NFKD and the combining-mark pass are no-ops on ASCII, and surrounding
+    # whitespace ends up as dashes that get stripped, so no special cases needed
+    s = s.str.translate(_G2L).str.normalize("NFKD").str.translate(_COMBINING)
+    s = s.str.replace(_SLUG_RE, "-", regex=True).str.strip("-")
+    return s.mask(s == "", "search")